@@ -155,6 +155,7 @@ CREATE TABLE IF NOT EXISTS equip.ag_equipment.tractors_error (
     weight_lbs DOUBLE,
     wheelbase_inches DOUBLE,
     hitch_lift_capacity DOUBLE,
+    id STRING,
     _validation_error STRING,
     _error_type STRING
 )
@@ -182,6 +183,7 @@ CREATE TABLE IF NOT EXISTS equip.ag_equipment.combines_error (
     unloading_rate_bu_min DOUBLE,
     unloading_auger_length_ft DOUBLE,
     weight_lbs DOUBLE,
+    id STRING,
     _validation_error STRING,
     _error_type STRING
 )
@@ -222,6 +224,7 @@ CREATE TABLE IF NOT EXISTS equip.ag_equipment.sprayers_error (
     weight_lbs DOUBLE,
     wheelbase_inches DOUBLE,
     transport_width_ft DOUBLE,
+    id STRING,
     _validation_error STRING,
     _error_type STRING
 )
@@ -249,6 +252,7 @@ CREATE TABLE IF NOT EXISTS equip.ag_equipment.implements_error (
     required_hp_max DOUBLE,
     number_of_rows INT,
     row_spacing_inches DOUBLE,
+    id STRING,
     _validation_error STRING,
     _error_type STRING
 )
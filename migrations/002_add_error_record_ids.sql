@@ -0,0 +1,10 @@
+-- Add a record key to error tables created before error records had ids
+-- Only run this against databases created with an older 001_create_tables.sql.
+-- The current 001 script already creates the id column, so fresh installs
+-- must skip this script (ADD COLUMN fails on an existing column).
+-- sprayers_error is left alone: the pipeline never writes sprayer errors and
+-- DELETE /errors/batch does not touch that table.
+
+ALTER TABLE equip.ag_equipment.tractors_error ADD COLUMN id STRING;
+ALTER TABLE equip.ag_equipment.combines_error ADD COLUMN id STRING;
+ALTER TABLE equip.ag_equipment.implements_error ADD COLUMN id STRING;
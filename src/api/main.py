@@ -6,11 +6,19 @@ and provides endpoints for user contributions.
 
 import logging
 import os
-from typing import Any
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Annotated, Any
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.openapi.docs import (
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import Response
+from pydantic import BaseModel, Field
 
 from core.databricks_utils import get_table_manager
 from core.models import (
@@ -49,13 +57,30 @@ def get_unity_catalog_manager() -> Any:
     return _table_manager
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the Unity Catalog connection on startup and close it on shutdown.
+
+    Args:
+        app: FastAPI application instance
+    """
+    global _table_manager
+    get_unity_catalog_manager()
+    yield
+    if _table_manager is not None:
+        _table_manager.close()
+        _table_manager = None
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="OpenAg-DB API",
     description="Public, community-driven agricultural equipment database API",
     version="0.1.0",
-    docs_url="/docs",
+    # /docs is served from a cached page below
+    docs_url=None,
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Configure CORS for frontend access
@@ -77,6 +102,42 @@ app.add_middleware(
 )
 
 
+@lru_cache(maxsize=8)
+def _swagger_ui_html(root_path: str) -> bytes:
+    """Render the Swagger UI page once per root path.
+
+    Args:
+        root_path: ASGI root path the app is mounted under
+
+    Returns:
+        Rendered HTML page
+    """
+    return bytes(
+        get_swagger_ui_html(
+            openapi_url=f"{root_path}{app.openapi_url}",
+            title=f"{app.title} - Swagger UI",
+            oauth2_redirect_url=f"{root_path}{app.swagger_ui_oauth2_redirect_url}",
+        ).body
+    )
+
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui(request: Request) -> Response:
+    """Serve the Swagger UI documentation page.
+
+    The OpenAPI schema itself is already cached by FastAPI after the first
+    request, so only the rendered page needs caching here.
+    """
+    html = _swagger_ui_html(request.scope.get("root_path", ""))
+    return Response(content=html, media_type="text/html")
+
+
+@app.get("/docs/oauth2-redirect", include_in_schema=False)
+async def swagger_ui_redirect() -> Response:
+    """Serve the OAuth2 redirect page used by the Swagger UI."""
+    return get_swagger_ui_oauth2_redirect_html()
+
+
 class HealthResponse(BaseModel):
     """Health check response model."""
 
@@ -87,11 +148,18 @@ class HealthResponse(BaseModel):
 class SearchFilters(BaseModel):
     """Search filter parameters."""
 
-    make: str | None = None
-    model: str | None = None
-    category: EquipmentCategory | None = None
-    year_min: int | None = None
-    year_max: int | None = None
+    make: str | None = Field(None, description="Filter by manufacturer")
+    model: str | None = Field(None, description="Filter by model")
+    category: EquipmentCategory | None = Field(None, description="Filter by category")
+    year_min: int | None = Field(None, description="Minimum year")
+    year_max: int | None = Field(None, description="Maximum year")
+
+
+class EquipmentListParams(SearchFilters):
+    """Query parameters for listing equipment."""
+
+    limit: int = Field(100, ge=1, le=1000, description="Maximum number of results")
+    offset: int = Field(0, ge=0, description="Offset for pagination")
 
 
 class ContributionRequest(BaseModel):
@@ -117,10 +185,21 @@ class ErrorRecord(BaseModel):
     data: dict[str, Any]
 
 
+# Error tables written by the scraping pipeline
+ERROR_TABLES = [
+    "tractors_error",
+    "combines_error",
+    "implements_error",
+]
+
+# Maximum number of IDs accepted by a single batch delete
+MAX_BATCH_DELETE_IDS = 100
+
+
 class BatchDeleteRequest(BaseModel):
     """Request to batch delete error records."""
 
-    ids: list[str]
+    ids: list[str] = Field(max_length=MAX_BATCH_DELETE_IDS)
 
 
 @app.get("/", response_model=HealthResponse)
@@ -145,28 +224,20 @@ async def health_check() -> HealthResponse:
 
 @app.get("/equipment", response_model=list[CommonEquipment])
 async def list_equipment(
-    category: EquipmentCategory | None = Query(None, description="Filter by category"),
-    make: str | None = Query(None, description="Filter by manufacturer"),
-    model: str | None = Query(None, description="Filter by model"),
-    year_min: int | None = Query(None, description="Minimum year"),
-    year_max: int | None = Query(None, description="Maximum year"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    params: Annotated[EquipmentListParams, Query()],
 ) -> list[CommonEquipment]:
     """List equipment with optional filters.
 
     Args:
-        category: Filter by equipment category
-        make: Filter by manufacturer
-        model: Filter by model
-        year_min: Filter by minimum year
-        year_max: Filter by maximum year
-        limit: Maximum number of results
-        offset: Offset for pagination
+        params: Category, make, model and year filters plus pagination
 
     Returns:
         List of equipment matching filters
     """
+    category = params.category
+    year_min, year_max = params.year_min, params.year_max
+    limit, offset = params.limit, params.offset
+
     manager = get_unity_catalog_manager()
     if manager is None:
         logger.warning("Unity Catalog not configured, returning empty list")
@@ -175,10 +246,10 @@ async def list_equipment(
     try:
         # Build filters dictionary
         filters: dict[str, Any] = {}
-        if make:
-            filters["make"] = make
-        if model:
-            filters["model"] = model
+        if params.make:
+            filters["make"] = params.make
+        if params.model:
+            filters["model"] = params.model
 
         # Determine which tables to query based on category
         results: list[CommonEquipment] = []
@@ -545,21 +616,38 @@ async def list_error_records(
 async def batch_delete_errors(request: BatchDeleteRequest) -> None:
     """Batch delete error records by IDs.
 
+    Each error table is cleared with a single parameterized DELETE on its
+    ``id`` column for the whole batch rather than one statement per ID.
+
     Args:
-        request: List of error record IDs to delete
+        request: List of error record IDs to delete (at most 100)
 
-    Note:
-        This is a placeholder. Actual implementation would delete records
-        from Unity Catalog error tables.
+    Raises:
+        HTTPException: If no IDs are provided, or if any error table could
+            not be updated
     """
-    # Placeholder for actual deletion logic
-    # In production, this would:
-    # 1. Connect to Unity Catalog using databricks_utils (DuckDB)
-    # 2. Delete records from appropriate error tables
-    # 3. Return success status
     if not request.ids:
         raise HTTPException(status_code=400, detail="No IDs provided for deletion")
 
+    manager = get_unity_catalog_manager()
+    if manager is None:
+        logger.warning("Unity Catalog not configured, no error records deleted")
+        return
+
+    failed_tables = []
+    for table_name in ERROR_TABLES:
+        try:
+            manager.delete_records(table_name, "id", request.ids)
+        except Exception as e:
+            logger.error(f"Failed to delete records from {table_name}: {e}")
+            failed_tables.append(table_name)
+
+    if failed_tables:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to delete error records from: {', '.join(failed_tables)}",
+        )
+
 
 def main() -> None:
     """Run the API server (for development).
@@ -13,6 +13,11 @@ from urllib.parse import urlparse
 import duckdb
 from pydantic import BaseModel
 
+# Patterns for values interpolated into SQL statements
+_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+# Common SQL types with optional parameters, e.g. DECIMAL(10, 2)
+_SQL_TYPE_RE = re.compile(r"^[A-Z_][A-Z0-9_]*(\([0-9,\s]+\))?$", re.IGNORECASE)
+
 
 def _validate_identifier(identifier: str, name: str = "identifier") -> None:
     """Validate that an identifier is safe to use in SQL.
@@ -24,7 +29,7 @@ def _validate_identifier(identifier: str, name: str = "identifier") -> None:
     Raises:
         ValueError: If identifier contains invalid characters
     """
-    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", identifier):
+    if not _IDENTIFIER_RE.match(identifier):
         raise ValueError(
             f"Invalid {name}: '{identifier}'. Must contain only alphanumeric "
             "characters and underscores, and start with a letter or underscore."
@@ -40,8 +45,7 @@ def _validate_sql_type(sql_type: str) -> None:
     Raises:
         ValueError: If SQL type contains invalid characters
     """
-    # Allow common SQL types with optional parameters
-    if not re.match(r"^[A-Z_][A-Z0-9_]*(\([0-9,\s]+\))?$", sql_type, re.IGNORECASE):
+    if not _SQL_TYPE_RE.match(sql_type):
         raise ValueError(
             f"Invalid SQL type: '{sql_type}'. Must be a valid SQL type name."
         )
@@ -73,6 +77,8 @@ class TableManager:
         self.config = config
         self._connection: duckdb.DuckDBPyConnection | None = None
         self._initialized = False
+        # Table schemas from DESCRIBE, keyed by table name
+        self._schema_cache: dict[str, dict[str, str]] = {}
 
     def _get_connection(self) -> duckdb.DuckDBPyConnection:
         """Get or create the DuckDB connection with Unity Catalog.
@@ -176,6 +182,7 @@ class TableManager:
         """
 
         conn.execute(create_stmt)
+        self.invalidate_schema(table_name)
 
     def insert_records(self, table_name: str, records: list[dict[str, Any]]) -> None:
         """Insert records into a Delta table.
@@ -191,6 +198,11 @@ class TableManager:
         Note:
             All records must have the same set of keys. For upsert behavior
             (update if exists, insert if not), use MERGE logic separately.
+            When pyarrow is installed, the records are inserted as a single
+            Arrow batch; otherwise they are inserted with executemany. Batches
+            Arrow cannot type (e.g. raw error items mixing "5" and 5.0 in one
+            column) also use executemany, where DuckDB casts each value to the
+            column type.
         """
         if not records:
             return
@@ -224,6 +236,36 @@ class TableManager:
                 raise ValueError(error_msg)
 
         columns_str = ", ".join(columns)
+
+        try:
+            import pyarrow as pa
+        except ImportError:
+            pa = None
+
+        batch = None
+        if pa is not None:
+            try:
+                batch = pa.Table.from_pylist(records)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # A column mixes Python types Arrow can't unify; insert row by
+                # row below instead
+                batch = None
+
+        if batch is not None:
+            # Hand DuckDB the whole batch as one Arrow table so it is ingested
+            # column-wise instead of row by row
+            conn.register("_insert_batch", batch)
+            try:
+                conn.execute(
+                    f"INSERT INTO {full_table_name} ({columns_str}) "
+                    f"SELECT {columns_str} FROM _insert_batch"
+                )
+            finally:
+                conn.unregister("_insert_batch")
+            return
+
+        # Without pyarrow (the optional "data" extra) or an Arrow-typeable
+        # batch, fall back to a parameterized executemany
         placeholders = ", ".join(["?" for _ in columns])
 
         insert_stmt = f"""
@@ -237,6 +279,40 @@ class TableManager:
         # Execute batch insert
         conn.executemany(insert_stmt, data)
 
+    def delete_records(self, table_name: str, column: str, values: list[Any]) -> None:
+        """Delete records whose column matches any of the given values.
+
+        All values are bound to a single ``DELETE ... WHERE column IN (...)``
+        statement, so the batch costs one round-trip.
+
+        Args:
+            table_name: Name of the table
+            column: Column to match values against
+            values: Values identifying the records to delete
+
+        Raises:
+            ValueError: If table_name or column contain invalid characters
+        """
+        if not values:
+            return
+
+        # Validate table and column names
+        _validate_identifier(table_name, "table_name")
+        _validate_identifier(column, f"column name '{column}'")
+
+        conn = self._get_connection()
+
+        full_table_name = (
+            f"{self.config.catalog_name}.{self.config.schema_name}.{table_name}"
+        )
+
+        placeholders = ", ".join(["?" for _ in values])
+        delete_stmt = (
+            f"DELETE FROM {full_table_name} WHERE {column} IN ({placeholders})"
+        )
+
+        conn.execute(delete_stmt, list(values))
+
     def query_table(
         self, table_name: str, filters: dict[str, Any] | None = None
     ) -> list[dict[str, Any]]:
@@ -305,6 +381,9 @@ class TableManager:
     def get_table_schema(self, table_name: str) -> dict[str, str]:
         """Get the schema of a table.
 
+        The schema is described once per table and cached on the manager;
+        use invalidate_schema() after altering a table outside this class.
+
         Args:
             table_name: Name of the table
 
@@ -317,6 +396,10 @@ class TableManager:
         # Validate table name
         _validate_identifier(table_name, "table_name")
 
+        cached = self._schema_cache.get(table_name)
+        if cached is not None:
+            return dict(cached)
+
         conn = self._get_connection()
 
         full_table_name = (
@@ -331,7 +414,19 @@ class TableManager:
             col_type = row[1]
             schema[col_name] = col_type
 
-        return schema
+        self._schema_cache[table_name] = schema
+        return dict(schema)
+
+    def invalidate_schema(self, table_name: str | None = None) -> None:
+        """Drop cached table schemas.
+
+        Args:
+            table_name: Table whose schema to drop, or None to drop all
+        """
+        if table_name is None:
+            self._schema_cache.clear()
+        else:
+            self._schema_cache.pop(table_name, None)
 
     def get_table_history(
         self, table_name: str, limit: int = 10
@@ -160,7 +160,8 @@ def generate_migration_sql() -> str:
 
     for error_table_name, model_class in error_tables:
         schema_dict = get_schema_from_model(model_class)
-        # Add error tracking fields
+        # Add the record key and error tracking fields
+        schema_dict["id"] = "STRING"
         schema_dict["_validation_error"] = "STRING"
         schema_dict["_error_type"] = "STRING"
 
@@ -111,7 +111,9 @@ class Tractor(CommonEquipment):
     Extends CommonEquipment with tractor-specific attributes.
     """
 
-    category: Literal[EquipmentCategory.TRACTOR] = EquipmentCategory.TRACTOR
+    category: Literal[EquipmentCategory.TRACTOR] = Field(
+        default=EquipmentCategory.TRACTOR, frozen=True
+    )
 
     # Power specifications
     pto_hp: float | None = Field(None, description="Power Take-Off horsepower", ge=0)
@@ -154,7 +156,9 @@ class Combine(CommonEquipment):
     Extends CommonEquipment with combine-specific attributes.
     """
 
-    category: Literal[EquipmentCategory.COMBINE] = EquipmentCategory.COMBINE
+    category: Literal[EquipmentCategory.COMBINE] = Field(
+        default=EquipmentCategory.COMBINE, frozen=True
+    )
 
     # Power
     engine_hp: float | None = Field(None, description="Engine horsepower", ge=0)
@@ -192,7 +196,9 @@ class Sprayer(CommonEquipment):
     chemical application equipment.
     """
 
-    category: Literal[EquipmentCategory.SPRAYER] = EquipmentCategory.SPRAYER
+    category: Literal[EquipmentCategory.SPRAYER] = Field(
+        default=EquipmentCategory.SPRAYER, frozen=True
+    )
 
     # Power and engine
     engine_hp: float | None = Field(None, description="Engine horsepower", ge=0)
@@ -281,7 +287,9 @@ class Implement(CommonEquipment):
     Extends CommonEquipment with implement-specific attributes.
     """
 
-    category: Literal[EquipmentCategory.IMPLEMENT] = EquipmentCategory.IMPLEMENT
+    category: Literal[EquipmentCategory.IMPLEMENT] = Field(
+        default=EquipmentCategory.IMPLEMENT, frozen=True
+    )
 
     # Physical specifications
     working_width_ft: float | None = Field(
@@ -324,6 +332,15 @@ class Implement(CommonEquipment):
 # Union type for all equipment types
 Equipment = Tractor | Combine | Sprayer | Implement | CommonEquipment
 
+# Category -> model class lookup used by create_equipment. StrEnum members hash
+# like their string values, so both enum and raw string categories resolve.
+_CATEGORY_CLS: dict[str, type[CommonEquipment]] = {
+    EquipmentCategory.TRACTOR: Tractor,
+    EquipmentCategory.COMBINE: Combine,
+    EquipmentCategory.SPRAYER: Sprayer,
+    EquipmentCategory.IMPLEMENT: Implement,
+}
+
 
 def create_equipment(data: dict) -> Equipment:
     """Create the appropriate equipment model based on category.
@@ -340,16 +357,11 @@ def create_equipment(data: dict) -> Equipment:
         returns a CommonEquipment instance.
     """
     category = data.get("category")
-
-    if category == EquipmentCategory.TRACTOR:
-        return Tractor(**data)
-    elif category == EquipmentCategory.COMBINE:
-        return Combine(**data)
-    elif category == EquipmentCategory.SPRAYER:
-        return Sprayer(**data)
-    elif category == EquipmentCategory.IMPLEMENT:
-        return Implement(**data)
-    else:
-        # For other categories (harvester, planter, etc.),
-        # use CommonEquipment base model
-        return CommonEquipment(**data)
+    # Non-string categories (including unhashable ones) fall through to
+    # CommonEquipment so model validation reports them as a ValidationError.
+    cls = (
+        _CATEGORY_CLS.get(category, CommonEquipment)
+        if isinstance(category, str)
+        else CommonEquipment
+    )
+    return cls.model_validate(data)
@@ -7,6 +7,8 @@ models to derive the table schemas.
 
 import logging
 import sys
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel
@@ -84,7 +86,18 @@ def get_schema_from_model(model_class: type[BaseModel]) -> dict[str, str]:
         model_class: Pydantic model class
 
     Returns:
-        Dictionary mapping column names to SQL types
+        Dictionary mapping column names to SQL types. A new dictionary is
+        returned on every call, so callers may add columns to it.
+    """
+    return dict(_model_schema(model_class))
+
+
+@cache
+def _model_schema(model_class: type[BaseModel]) -> MappingProxyType[str, str]:
+    """Derive a model's SQL schema once per model class.
+
+    The cached schema is shared between calls, so it is returned read-only;
+    use get_schema_from_model for a mutable copy.
     """
     schema: dict[str, str] = {}
 
@@ -99,7 +112,7 @@ def get_schema_from_model(model_class: type[BaseModel]) -> dict[str, str]:
 
         schema[field_name] = sql_type
 
-    return schema
+    return MappingProxyType(schema)
 
 
 def setup_table(
@@ -140,8 +153,9 @@ def setup_error_table(
 ) -> bool:
     """Create or verify an error table exists with the correct schema.
 
-    Error tables have the same schema as the base table plus additional
-    error tracking fields: _validation_error and _error_type.
+    Error tables have the same schema as the base table plus an ``id`` key
+    for each error record and the error tracking fields _validation_error
+    and _error_type.
 
     Args:
         table_manager: TableManager instance
@@ -157,7 +171,8 @@ def setup_error_table(
         # Get schema from Pydantic model
         schema = get_schema_from_model(model_class)
 
-        # Add error tracking fields
+        # Add the record key and error tracking fields
+        schema["id"] = "VARCHAR"
         schema["_validation_error"] = "VARCHAR"
         schema["_error_type"] = "VARCHAR"
 
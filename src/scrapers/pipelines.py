@@ -5,6 +5,7 @@ Pipelines:
 2. UnityCatalogWriterPipeline - Writes validated data to Unity Catalog Delta tables
 """
 
+import uuid
 from typing import Any
 
 from pydantic import ValidationError
@@ -60,6 +61,7 @@ class ValidationPipeline:
         Note:
             Failed items are marked with '_validation_error' and passed to
             the next pipeline for writing to error tables instead of being dropped.
+            Each error item gets a unique 'id' so it can be deleted later.
         """
         try:
             # Create appropriate equipment model based on category
@@ -80,6 +82,7 @@ class ValidationPipeline:
             # Mark item as error and pass to writer pipeline instead of dropping
             error_item = {
                 **item,  # Keep original data
+                "id": uuid.uuid4().hex,
                 "_validation_error": str(e),
                 "_error_type": "ValidationError",
             }
@@ -89,6 +92,7 @@ class ValidationPipeline:
             # Mark item as error and pass to writer pipeline instead of dropping
             error_item = {
                 **item,  # Keep original data
+                "id": uuid.uuid4().hex,
                 "_validation_error": str(e),
                 "_error_type": type(e).__name__,
             }
@@ -4,6 +4,8 @@ For more information on Scrapy settings see:
 https://docs.scrapy.org/en/latest/topics/settings.html
 """
 
+import os
+
 BOT_NAME = "openagdb"
 
 SPIDER_MODULES = ["scrapers.spiders"]
@@ -83,6 +85,12 @@ PLAYWRIGHT_LAUNCH_OPTIONS = {
     "timeout": 30000,  # 30 seconds
 }
 
+# Connect to an already running Chromium over CDP instead of launching one per
+# crawl, so concurrent or repeated crawls share one browser and its caches.
+# Start it once with e.g. `chromium --headless --remote-debugging-port=9222`
+# and set PLAYWRIGHT_CDP_URL=http://localhost:9222. Unset launches a browser.
+PLAYWRIGHT_CDP_URL = os.getenv("PLAYWRIGHT_CDP_URL")
+
 # Maximum number of concurrent Playwright contexts
 PLAYWRIGHT_MAX_CONTEXTS = 4
 
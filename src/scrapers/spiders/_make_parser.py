@@ -0,0 +1,55 @@
+"""Make/model splitting for equipment listing titles.
+
+This module has no Scrapy dependency, so the title parsing used by the
+spiders can be imported and tested on its own.
+"""
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8)
+def _build_make_pattern(makes: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile an anchored alternation of manufacturer names.
+
+    Longer makes come first so "Case IH" wins over a shorter "Case"; if the
+    longer make leaves no model, the regex backtracks to the shorter one.
+    """
+    # "(?!)" never matches, so an empty make list falls through to the split
+    alternation = (
+        "|".join(map(re.escape, sorted(makes, key=len, reverse=True))) or "(?!)"
+    )
+    return re.compile(rf"({alternation})\s*(.+)", re.DOTALL)
+
+
+@lru_cache(maxsize=4096)
+def _parse_stripped(title: str, makes: tuple[str, ...]) -> tuple[str, str] | None:
+    """Split an already stripped title; cached per (title, makes) pair."""
+    # Everything after the make is the model
+    match = _build_make_pattern(makes).match(title)
+    if match:
+        return match.group(1), match.group(2)
+
+    # Fallback: split on first space
+    parts = title.split(maxsplit=1)
+    if len(parts) >= 2:
+        return parts[0], parts[1]
+
+    return None
+
+
+def parse_make_model(title: str, makes: tuple[str, ...]) -> tuple[str, str] | None:
+    """Parse make and model from a title string.
+
+    The longest known make prefixing the title wins; titles with no known
+    make are split on their first space. Titles repeat across table rows and
+    pages, so results are cached.
+
+    Args:
+        title: Title string like "John Deere 5075E"
+        makes: Known manufacturer names
+
+    Returns:
+        Tuple of (make, model) or None if parsing fails
+    """
+    return _parse_stripped(title.strip(), makes)
@@ -57,15 +57,14 @@ class BaseEquipmentSpider(scrapy.Spider):
         Returns:
             Equipment item dictionary ready for validation
         """
-        item = {
+        item: dict[str, Any] = {
             "make": make.strip(),
             "model": model.strip(),
             "category": category.value,
-            **kwargs,
         }
-
-        # Remove None values
-        return {k: v for k, v in item.items() if v is not None}
+        # Skip None values while copying, rather than copying then filtering
+        item.update((k, v) for k, v in kwargs.items() if v is not None)
+        return item
 
 
 class TractorDataSpider(BaseEquipmentSpider):
@@ -31,17 +31,331 @@ The mapping function handles:
 - Various gear format patterns ("8F/4R", "12/6", "42", etc.)
 """
 
+import asyncio
+import hashlib
 import json
-from collections.abc import Iterator
-from typing import Any
+import re
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode
 
+from lxml.etree import XPath
 from scrapy import Request
-from scrapy.http import Response
+from scrapy.http import Response, TextResponse
 
 from core.models import EquipmentCategory
+from scrapers.spiders._make_parser import parse_make_model
 from scrapers.spiders.base_spider import BaseEquipmentSpider
 
+if TYPE_CHECKING:
+    from scrapy_playwright.page import PageMethod
+
+
+def _class_predicate(*class_names: str) -> str:
+    """Build an XPath predicate equivalent to a CSS class selector union."""
+    return " or ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+        for class_name in class_names
+    )
+
+
+def _first(xpath: XPath, node: Any, default: str = "") -> str:
+    """Return the first result of a compiled XPath evaluated on an lxml node."""
+    results = xpath(node)
+    return str(results[0]) if results else default
+
+
+# Selectors evaluated on every row, card or spec entry, compiled once. They are
+# applied to the underlying lxml node (``selector.root``), which skips the CSS
+# to XPath translation and per-result Selector wrapping parsel would do.
+# CSS selector unions are folded into a single ``or`` predicate.
+
+# Card fields
+_CARD_MAKE = XPath(
+    f"descendant-or-self::*[{_class_predicate('make', 'manufacturer')}]/text()"
+)
+_CARD_MODEL = XPath(
+    f"descendant-or-self::*[{_class_predicate('model', 'model-name')}]/text()"
+)
+_CARD_TITLE = XPath(
+    f"descendant-or-self::*[self::h2 or self::h3 or {_class_predicate('title')}]/text()"
+)
+_CARD_SERIES = XPath(f"descendant-or-self::*[{_class_predicate('series')}]/text()")
+_CARD_HP = XPath(
+    f"descendant-or-self::*[{_class_predicate('horsepower', 'hp')}]/text()"
+)
+_CARD_DESCRIPTION = XPath(
+    f"descendant-or-self::*[self::p or {_class_predicate('description')}]/text()"
+)
+_CARD_IMAGE = XPath("descendant-or-self::img/@src")
+
+# Listing table rows (table.specs-table tr, falling back to table tr) and their
+# cells (td::text, td a::text)
+_SPECS_TABLE_ROWS = XPath(
+    f"descendant-or-self::table[{_class_predicate('specs-table')}]//tr"
+)
+_ANY_TABLE_ROWS = XPath("descendant-or-self::table//tr")
+_ROW_CELL_TEXT = XPath(
+    "descendant-or-self::td/text() | descendant-or-self::td//a/text()"
+)
+
+# Listing fallbacks when there is no table: card containers (.tractor-card,
+# .product-card, .spec-item), then generic product entries (div[class*='product'],
+# div[class*='item'], div[class*='tractor'], li[class*='product']), then links
+# to tractor detail pages (a[href*="tractor"]::attr(href))
+_CARDS = XPath(
+    "descendant-or-self::*"
+    f"[{_class_predicate('tractor-card', 'product-card', 'spec-item')}]"
+)
+_PRODUCT_ITEMS = XPath(
+    "descendant-or-self::*[(self::div and (contains(@class, 'product')"
+    " or contains(@class, 'item') or contains(@class, 'tractor')))"
+    " or (self::li and contains(@class, 'product'))]"
+)
+_TRACTOR_LINKS = XPath("descendant-or-self::a[contains(@href, 'tractor')]/@href")
+
+# Model details table populated by AJAX
+_DETAILS_TABLES = XPath(
+    "descendant-or-self::*[@id = 'tractor-details' or "
+    f"{_class_predicate('tractor-details-data')}]"
+)
+_DETAILS_ROW_COUNT = XPath("count(.//tr)")
+_DETAILS_ROWS = XPath(".//tr[td[2]]")
+_SELECTED_MODEL = XPath(
+    "descendant-or-self::*[@id = 'tractor-model']//option[@selected]/text()"
+)
+
+# First text node of a key/value row's two cells, and of a dt and its dd, each
+# fetched with a single query (results come back in document order)
+_KEY_VALUE_CELLS = XPath("td[1]/descendant::text()[1] | td[2]/descendant::text()[1]")
+_TERM_DEFINITION = XPath(
+    "descendant::text()[1] | following-sibling::dd[1]/descendant::text()[1]"
+)
+
+# Spec containers
+_TERMS = XPath("descendant-or-self::dt")
+_TERM_TEXT = XPath("descendant-or-self::text()")
+_DEFINITION_TEXT = XPath("following-sibling::dd[1]//text()")
+_SPEC_ITEMS = XPath(
+    f"descendant-or-self::*[{_class_predicate('spec-item', 'attribute-item')}]"
+)
+_SPEC_ITEM_KEY = XPath(
+    f"descendant-or-self::*[{_class_predicate('label', 'key')}]/text()"
+)
+_SPEC_ITEM_VALUE = XPath(
+    f"descendant-or-self::*[{_class_predicate('value', 'val')}]/text()"
+)
+_TABLE_ROWS = XPath("descendant-or-self::tr")
+_CELL_TEXT = XPath("descendant-or-self::td/text()")
+
+# Tractor detail page
+_DETAIL_TITLE = XPath(
+    f"descendant-or-self::*[self::h1 or {_class_predicate('product-title')}]/text()"
+)
+_DETAIL_SPEC_TERMS = XPath(
+    f"descendant-or-self::*[{_class_predicate('specs', 'specifications')}]//dl//dt"
+)
+_DETAIL_IMAGE = XPath(
+    f"descendant-or-self::*[{_class_predicate('product-image')}]//img/@src"
+)
+
+
+# Unit suffixes and thousands separators stripped from numeric spec values.
+# Units go in one regex pass and commas in one translate pass instead of a
+# chain of str.replace calls
+_HP_UNIT_RE = re.compile("HP|hp")
+_NUMERIC_UNIT_RE = re.compile("lbs|HP|hp|in|gal|gpm|psi")
+_DROP_THOUSANDS = str.maketrans("", "", ",")
+
+
+def _set_series(value: str, item_data: dict[str, Any]) -> None:
+    """Store a series spec value."""
+    item_data["series"] = value
+
+
+def _set_engine_hp(value: str, item_data: dict[str, Any]) -> None:
+    """Store an engine horsepower spec value such as "75 HP"."""
+    try:
+        item_data["engine_hp"] = float(_HP_UNIT_RE.sub("", value).strip())
+    except ValueError:
+        pass
+
+
+def _set_pto_hp(value: str, item_data: dict[str, Any]) -> None:
+    """Store a PTO horsepower spec value such as "65 HP"."""
+    try:
+        item_data["pto_hp"] = float(_HP_UNIT_RE.sub("", value).strip())
+    except ValueError:
+        pass
+
+
+def _set_weight(value: str, item_data: dict[str, Any]) -> None:
+    """Store a weight spec value such as "7,700 lbs"."""
+    try:
+        item_data["weight_lbs"] = float(
+            value.replace("lbs", "").translate(_DROP_THOUSANDS).strip()
+        )
+    except ValueError:
+        pass
+
+
+def _set_transmission(value: str, item_data: dict[str, Any]) -> None:
+    """Store a transmission spec value, lowercased."""
+    item_data["transmission_type"] = value.lower()
+
+
+def _set_model(value: str, item_data: dict[str, Any]) -> None:
+    """Store a model spec value unless the model is already known."""
+    item_data.setdefault("model", value)
+
+
+_SpecHandler = Callable[[str, dict[str, Any]], None]
+
+# Spec keys (lowercased) seen verbatim on spec pages, mapped straight to their
+# handler
+_SPEC_HANDLERS: dict[str, _SpecHandler] = {
+    "series": _set_series,
+    "engine hp": _set_engine_hp,
+    "pto hp": _set_pto_hp,
+    "weight": _set_weight,
+    "transmission": _set_transmission,
+    "model": _set_model,
+}
+
+# Keyword rules for other keys, checked in order; the first rule whose
+# keywords all appear in the key wins
+_SPEC_RULES: tuple[tuple[tuple[str, ...], _SpecHandler], ...] = (
+    (("series",), _set_series),
+    (("engine", "hp"), _set_engine_hp),
+    (("pto", "hp"), _set_pto_hp),
+    (("weight",), _set_weight),
+    (("transmission",), _set_transmission),
+    (("model",), _set_model),
+)
+
+# JavaScript run in the page by the Playwright requests. Values that change per
+# request (make name, model index) are passed as the evaluate argument instead
+# of being formatted into the source.
+_LOAD_MAKES_JS = """() => {
+    const makeSelect = document.querySelector('#tractor-make');
+    if (!makeSelect) return { error: 'Make select not found' };
+
+    // If dropdown only has placeholder, trigger AJAX manually
+    if (makeSelect.options.length <= 1) {
+        return new Promise((resolve) => {
+            $.getJSON(
+                'https://app.smalink.net/pim/tractor-specs.php'
+                    + '?tractor_make=tractor-specs-make',
+                function(result) {
+                    if (result && result.data) {
+                        result.data.forEach(function(data) {
+                            $('#tractor-make').append(
+                                '<option value="' + data.make_slug + '">'
+                                    + data.make + '</option>'
+                            );
+                        });
+                    }
+                    resolve({ manually_loaded: true, count: result.data.length });
+                }
+            );
+        });
+    }
+    return { already_loaded: true, count: makeSelect.options.length };
+}"""
+
+_SELECT_MAKE_JS = """(make) => {
+    const makeSelect = document.querySelector('#tractor-make');
+    if (!makeSelect) return { error: 'Make select not found' };
+    const options = Array.from(makeSelect.options);
+    const option = options.find(opt => opt.text.includes(make));
+    if (option) {
+        makeSelect.value = option.value;
+        makeSelect.dispatchEvent(new Event('change', { bubbles: true }));
+        return { success: true, selected: option.text, value: option.value };
+    }
+    return { error: 'Make option not found', available: options.map(o => o.text) };
+}"""
+
+_SELECT_MODEL_JS = """(modelIndex) => {
+    const modelSelect = document.querySelector('#tractor-model');
+    if (!modelSelect) return { error: 'Model select not found' };
+    const options = Array.from(modelSelect.options);
+    // Skip first option (placeholder 'Select One')
+    const targetIndex = modelIndex + 1;
+    if (targetIndex < options.length) {
+        modelSelect.value = options[targetIndex].value;
+        modelSelect.dispatchEvent(new Event('change', { bubbles: true }));
+        return {
+            success: true,
+            selected: options[targetIndex].text,
+            value: options[targetIndex].value,
+        };
+    }
+    return {
+        error: 'Model index out of range',
+        available: options.length,
+        requested: targetIndex,
+    };
+}"""
+
+_SELECT_ANY_MAKE_JS = """(make) => {
+    const selects = document.querySelectorAll('select');
+    for (const select of selects) {
+        const options = Array.from(select.options);
+        const option = options.find(opt => opt.text.includes(make));
+        if (option) {
+            select.value = option.value;
+            select.dispatchEvent(new Event('change', { bubbles: true }));
+            return true;
+        }
+    }
+    return false;
+}"""
+
+
+# Page methods are built fresh for every request: scrapy-playwright stores
+# each method's outcome on its PageMethod object, so sharing one between
+# concurrent requests would mix up their results. scrapy-playwright is only in
+# the optional "scraping" extra, so it is imported when a request is built.
+
+
+def _static_wait_methods() -> list["PageMethod"]:
+    """Build the page methods that load the page and its make dropdown."""
+    from scrapy_playwright.page import PageMethod
+
+    return [
+        PageMethod("wait_for_load_state", "load"),
+        PageMethod("wait_for_selector", "#tractor-make", timeout=10000),
+        # jQuery is required for the AJAX calls that populate the dropdowns
+        PageMethod("wait_for_function", "() => typeof $ === 'function'", timeout=20000),
+        # Wait for document ready and the initial AJAX to complete
+        PageMethod("wait_for_timeout", 5000),
+        # Populate the make dropdown manually if the page didn't
+        PageMethod("evaluate", _LOAD_MAKES_JS),
+        PageMethod("wait_for_timeout", 2000),
+    ]
+
+
+def _select_model_methods(make: str, model_index: int) -> list["PageMethod"]:
+    """Build the page methods that pick a make and model from the dropdowns."""
+    from scrapy_playwright.page import PageMethod
+
+    return [
+        PageMethod("evaluate", _SELECT_MAKE_JS, make),
+        # Wait for model dropdown to populate via AJAX
+        PageMethod("wait_for_timeout", 5000),
+        PageMethod("evaluate", _SELECT_MODEL_JS, model_index),
+        # Wait for tractor details data to load via AJAX
+        PageMethod("wait_for_timeout", 5000),
+        PageMethod(
+            "wait_for_selector",
+            "#tractor-details, .tractor-details-data",
+            timeout=10000,
+        ),
+    ]
+
 
 class QualityFarmSupplySpider(BaseEquipmentSpider):
     """Spider for Quality Farm Supply tractor specifications page.
@@ -66,6 +380,9 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
 
     default_category = EquipmentCategory.TRACTOR
 
+    # Prototype for items built in the listing parsers
+    _BASE_ITEM: dict[str, Any] = {"category": default_category}
+
     # Custom settings to ensure Playwright is enabled for this spider
     custom_settings = {
         "DOWNLOAD_HANDLERS": {
@@ -79,7 +396,7 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
     }
 
     # Example makes to filter for (can be customized)
-    target_makes = ["John Deere", "Case IH", "New Holland", "Kubota", "Massey Ferguson"]
+    target_makes = ("John Deere", "Case IH", "New Holland", "Kubota", "Massey Ferguson")
 
     # Prefer API endpoints instead of page parsing
     use_api_endpoints = True
@@ -96,10 +413,19 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
         "Sec-Fetch-Site": "cross-site",
     }
 
+    # Static assets requested by Playwright pages are cached on disk, keyed by
+    # URL, so repeated crawls don't fetch them from the CDN again. The pattern
+    # only looks at the path, so versioned CDN URLs such as app.js?v=123 match
+    static_cache_dir = Path(".playwright_cache")
+    static_asset_pattern = re.compile(
+        r"^[^?#]*\.(?:js|css|png|woff2|gif|webp)(?:[?#]|$)"
+    )
+    # Cached assets older than this (in seconds) are fetched again, and are
+    # deleted from disk when the spider starts
+    static_cache_ttl = 7 * 24 * 60 * 60
+
     # Known manufacturer names for parsing
-    # (ordered by length descending to match longest first)
-    # Known manufacturer names for parsing
-    # (ordered by length descending to match longest first)
+    # (the longest name prefixing a title wins, so order doesn't matter)
     known_makes = [
         "Massey Ferguson",
         "Massey-Ferguson",
@@ -166,6 +492,22 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
         "Memo",
     ]
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the spider and index its known and target makes.
+
+        Args:
+            *args: Positional arguments passed to the Scrapy spider
+            **kwargs: Keyword arguments passed to the Scrapy spider
+        """
+        super().__init__(*args, **kwargs)
+        # Hashable snapshot of known_makes used as the make/model cache key.
+        # Taken per instance so subclasses or spider arguments overriding
+        # known_makes are honored.
+        self._known_makes = tuple(self.known_makes)
+        # target_makes stays ordered so the per-make requests fan out in the
+        # same order on every run; the set is only for membership checks
+        self._target_make_set = frozenset(self.target_makes)
+
     def _parse_make_model(self, title: str) -> tuple[str, str] | None:
         """Parse make and model from a title string.
 
@@ -175,32 +517,20 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
         Returns:
             Tuple of (make, model) or None if parsing fails
         """
-        title = title.strip()
-
-        # Try to match known makes
-        for make in self.known_makes:
-            if title.startswith(make):
-                # Everything after the make is the model
-                model = title[len(make) :].strip()
-                if model:
-                    return make, model
-
-        # Fallback: split on first space
-        parts = title.split(maxsplit=1)
-        if len(parts) >= 2:
-            return parts[0], parts[1]
-
-        return None
+        return parse_make_model(title, self._known_makes)
 
     async def start(self) -> Iterator[Any]:
         """Generate initial requests.
 
         This method prefers JSON API endpoints for makes/models/specs. If API
         scraping is disabled, it falls back to Playwright-based HTML parsing.
+        Expired entries are swept from the static asset cache first.
 
         Yields:
             Scrapy requests for API or Playwright workflows
         """
+        await asyncio.to_thread(self._sweep_static_cache)
+
         if self.use_api_endpoints:
             params = {"tractor_make": "tractor-specs-make"}
             yield self._make_api_request(params, callback=self.parse_makes)
@@ -259,14 +589,22 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
         return False
 
     def parse_makes(self, response: Response) -> Iterator[Any]:
-        """Parse the list of makes from the API endpoint."""
+        """Parse the list of makes from the API endpoint.
+
+        The API requests use Scrapy's regular HTTP handler, so the browser is
+        only started if the API fails to return makes (e.g. it serves HTML),
+        in which case the Playwright-based page workflow is used instead.
+        """
         payload = self._load_json(response)
         makes = payload.get("data") or payload.get("makes") or []
 
         if not makes:
             self.logger.warning(
-                "No makes returned from API (%s)", response.meta.get("api_params")
+                "No makes returned from API (%s), falling back to Playwright",
+                response.meta.get("api_params"),
             )
+            for url in self.start_urls:
+                yield self._make_playwright_request(url, callback=self.parse)
             return
 
         for make_entry in makes:
@@ -384,18 +722,9 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
                 return None
             try:
                 # Remove common units and thousands separators
-                cleaned = (
-                    str(value)
-                    .replace(",", "")
-                    .replace("lbs", "")
-                    .replace("HP", "")
-                    .replace("hp", "")
-                    .replace("in", "")
-                    .replace("gal", "")
-                    .replace("gpm", "")
-                    .replace("psi", "")
-                    .strip()
-                )
+                cleaned = _NUMERIC_UNIT_RE.sub(
+                    "", str(value).translate(_DROP_THOUSANDS)
+                ).strip()
                 # Handle ranges by taking the first value
                 if "-" in cleaned and not cleaned.startswith("-"):
                     cleaned = cleaned.split("-")[0].strip()
@@ -628,136 +957,34 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
         Returns:
             Scrapy Request with Playwright meta options
         """
-        # Playwright page actions to execute
-        playwright_page_actions = []
+        from scrapy_playwright.page import PageMethod
 
         if make and model_index is not None:
-            # Actions to select both make and model from tractor-specific filters
-            playwright_page_actions = [
-                # Wait for the page to load completely
-                "page.wait_for_load_state('load')",
-                # Wait for tractor-make dropdown to be available
-                "page.wait_for_selector('#tractor-make', timeout=10000)",
-                # Wait for jQuery to load (required for AJAX calls)
-                (  # noqa: E501
-                    "page.wait_for_function("
-                    "'() => typeof $ === \"function\"', "
-                    "timeout=20000)"
-                ),
-                # Wait additional time for document ready and initial AJAX to complete
-                "page.wait_for_timeout(5000)",
-                # Check if make dropdown is populated, if not trigger AJAX manually
-                "page.evaluate('() => { "
-                "  const makeSelect = document.querySelector('#tractor-make'); "
-                "  if (!makeSelect) return { error: 'Make select not found' }; "
-                "  "
-                "  // If dropdown only has placeholder, trigger AJAX manually "
-                "  if (makeSelect.options.length <= 1) { "
-                "    // Manually call the AJAX endpoint "
-                "    return new Promise((resolve) => { "
-                "      $.getJSON("  # noqa: E501
-                "'https://app.smalink.net/pim/tractor-specs.php?"
-                "tractor_make=tractor-specs-make', function(result) { "
-                "        if (result && result.data) { "
-                "          result.data.forEach(function(data) { "
-                "            $('#tractor-make').append("  # noqa: E501
-                "'<option value=\"' + data.make_slug + '\">' + "
-                "data.make + '</option>'); "
-                "          }); "
-                "        } "
-                "        resolve("  # noqa: E501
-                "{ manually_loaded: true, count: result.data.length }); "
-                "      }); "
-                "    }); "
-                "  } "
-                "  return "  # noqa: E501
-                "{ already_loaded: true, count: makeSelect.options.length }; "
-                "}')",
-                # Wait for make dropdown population
-                "page.wait_for_timeout(2000)",
-                # Select the make from #tractor-make dropdown
-                f"page.evaluate('() => {{ "
-                f"  const makeSelect = document.querySelector('#tractor-make'); "
-                f"  if (!makeSelect) return {{ error: 'Make select not found' }}; "
-                f"  const options = Array.from(makeSelect.options); "
-                f'  const option = options.find(opt => opt.text.includes("{make}")); '
-                f"  if (option) {{ "
-                f"    makeSelect.value = option.value; "
-                f"    makeSelect.dispatchEvent("  # noqa: E501
-                f"new Event('change', {{ bubbles: true }})); "
-                f"    return {{ "  # noqa: E501
-                f"success: true, selected: option.text, value: option.value }}; "
-                f"  }} "
-                f"  return {{ "  # noqa: E501
-                f"error: 'Make option not found', "
-                f"available: options.map(o => o.text) }}; "
-                f"}}')",
-                # Wait for model dropdown to populate via AJAX
-                "page.wait_for_timeout(5000)",
-                # Select the model by index from #tractor-model dropdown
-                f"page.evaluate('() => {{ "
-                f"  const modelSelect = document.querySelector('#tractor-model'); "
-                f"  if (!modelSelect) return {{ error: 'Model select not found' }}; "
-                f"  const options = Array.from(modelSelect.options); "
-                f"  // Skip first option (placeholder 'Select One') "
-                f"  const targetIndex = {model_index + 1}; "
-                f"  if (targetIndex < options.length) {{ "
-                f"    modelSelect.value = options[targetIndex].value; "
-                f"    modelSelect.dispatchEvent("  # noqa: E501
-                f"new Event('change', {{ bubbles: true }})); "
-                f"    return {{ "  # noqa: E501
-                f"success: true, selected: options[targetIndex].text, "
-                f"value: options[targetIndex].value }}; "
-                f"  }} "
-                f"  return {{ "  # noqa: E501
-                f"error: 'Model index out of range', "
-                f"available: options.length, requested: targetIndex }}; "
-                f"}}')",
-                # Wait for tractor details data to load via AJAX
-                "page.wait_for_timeout(5000)",
-                # Wait for the details table to appear
-                (  # noqa: E501
-                    "page.wait_for_selector("
-                    "'#tractor-details, .tractor-details-data', "
-                    "timeout=10000)"
-                ),
+            # Load the page, make sure the make dropdown is populated, then
+            # select the make and the model by index from the tractor filters
+            page_methods = [
+                *_static_wait_methods(),
+                *_select_model_methods(make, model_index),
             ]
         elif make:
-            # Actions to select only make from the filter
-            playwright_page_actions = [
-                # Wait for the page to load
-                "page.wait_for_load_state('networkidle')",
-                # Wait for filter elements to be available
-                (
-                    "page.wait_for_selector("
-                    "'select, .filter-select, [data-filter-make]', "
-                    "timeout=10000)"
+            # Select only the make from whichever filter dropdown offers it
+            page_methods = [
+                PageMethod("wait_for_load_state", "networkidle"),
+                PageMethod(
+                    "wait_for_selector",
+                    "select, .filter-select, [data-filter-make]",
+                    timeout=10000,
                 ),
-                # Try to find and click the make filter dropdown
-                f"page.evaluate('() => {{ "
-                f"  const selects = document.querySelectorAll('select'); "
-                f"  for (const select of selects) {{ "
-                f"    const options = Array.from(select.options); "
-                f'    const option = options.find(opt => opt.text.includes("{make}")); '
-                f"    if (option) {{ "
-                f"      select.value = option.value; "
-                f"      select.dispatchEvent("
-                f"        new Event('change', {{ bubbles: true }})"
-                f"      ); "
-                f"      return true; "
-                f"    }} "
-                f"  }} "
-                f"  return false; "
-                f"}}')",
+                PageMethod("evaluate", _SELECT_ANY_MAKE_JS, make),
                 # Wait for results to load after filtering
-                "page.wait_for_timeout(2000)",
+                PageMethod("wait_for_timeout", 2000),
             ]
         else:
-            # Just wait for the page to fully load
-            playwright_page_actions = [
-                "page.wait_for_load_state('networkidle')",
-                # Wait a bit for any dynamic content to render
-                "page.wait_for_timeout(2000)",
+            # Just wait for the page to fully load, then give dynamic content
+            # a moment to render
+            page_methods = [
+                PageMethod("wait_for_load_state", "networkidle"),
+                PageMethod("wait_for_timeout", 2000),
             ]
 
         return Request(
@@ -768,26 +995,107 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
             dont_filter=(make is not None or model_index is not None),
             meta={
                 "playwright": True,
-                "playwright_include_page": True,
-                "playwright_page_actions": playwright_page_actions,
-                "errback": self.errback_close_page,
+                "playwright_page_methods": page_methods,
+                "playwright_page_init_callback": self._init_page,
                 "make_filter": make,
                 "model_index": model_index,
             },
         )
 
-    async def errback_close_page(self, failure: Any) -> None:
-        """Error callback to close Playwright page on failure.
+    async def _init_page(self, page: Any, request: Request) -> None:
+        """Route static assets of a new Playwright page through the disk cache.
 
         Args:
-            failure: Scrapy failure object
+            page: Playwright page created for the request
+            request: Scrapy request the page was created for
         """
-        page = failure.request.meta.get("playwright_page")
-        if page:
-            await page.close()
-        self.logger.error(f"Error processing {failure.request.url}: {failure}")
+        await page.route(self.static_asset_pattern, self._serve_static_asset)
 
-    def parse_model_data(self, response: Response) -> Iterator[dict[str, Any]]:
+    async def _serve_static_asset(self, route: Any) -> None:
+        """Serve a static asset from the disk cache, fetching it on a miss.
+
+        Cache files are read and written in a worker thread so the event loop
+        shared by all Playwright pages is never blocked on disk IO. Responses
+        marked Cache-Control: no-store are served but never stored.
+
+        Args:
+            route: Playwright route for the intercepted asset request
+        """
+        key = hashlib.md5(route.request.url.encode(), usedforsecurity=False)
+        body_path = self.static_cache_dir / key.hexdigest()
+
+        cached = await asyncio.to_thread(self._read_cached_asset, body_path)
+        if cached is not None:
+            body, headers = cached
+            await route.fulfill(body=body, headers=headers)
+            return
+
+        response = await route.fetch()
+        body = await response.body()
+        cache_control = response.headers.get("cache-control", "").lower()
+        if response.ok and "no-store" not in cache_control:
+            # The stored body is already decoded, so drop the encoding headers
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in ("content-encoding", "content-length")
+            }
+            await asyncio.to_thread(self._write_cached_asset, body_path, body, headers)
+        await route.fulfill(response=response, body=body)
+
+    def _read_cached_asset(
+        self, body_path: Path
+    ) -> tuple[bytes, dict[str, str]] | None:
+        """Read a cached asset and its headers unless missing or expired.
+
+        Args:
+            body_path: Cache file holding the asset body
+
+        Returns:
+            Tuple of (body, headers), or None on a cache miss
+        """
+        headers_path = body_path.with_suffix(".json")
+        try:
+            age = time.time() - body_path.stat().st_mtime
+            if age > self.static_cache_ttl:
+                return None
+            return body_path.read_bytes(), json.loads(headers_path.read_text())
+        except (OSError, ValueError):
+            # Missing, half-written or unreadable entries count as misses
+            return None
+
+    def _write_cached_asset(
+        self, body_path: Path, body: bytes, headers: dict[str, str]
+    ) -> None:
+        """Store an asset body and its headers in the disk cache.
+
+        Args:
+            body_path: Cache file for the asset body
+            body: Decoded asset body
+            headers: Response headers to replay on a hit
+        """
+        self.static_cache_dir.mkdir(parents=True, exist_ok=True)
+        # Headers first: the body's mtime marks the entry's age
+        body_path.with_suffix(".json").write_text(json.dumps(headers))
+        body_path.write_bytes(body)
+
+    def _sweep_static_cache(self) -> None:
+        """Delete static asset cache files older than the cache TTL."""
+        cutoff = time.time() - self.static_cache_ttl
+        try:
+            paths = list(self.static_cache_dir.iterdir())
+        except OSError:
+            # Nothing has been cached yet
+            return
+        for path in paths:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                # Already removed or unreadable; the next sweep retries it
+                continue
+
+    def parse_model_data(self, response: TextResponse) -> Iterator[dict[str, Any]]:
         """Parse model-specific data after make and model selection.
 
         This method is called after both make and model have been selected
@@ -808,9 +1116,10 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
         )
 
         # Look for the tractor-details table (populated by AJAX)
-        details_table = response.css("#tractor-details, .tractor-details-data")
+        root = response.selector.root
+        details_tables = _DETAILS_TABLES(root)
 
-        if not details_table:
+        if not details_tables:
             self.logger.warning(
                 f"No tractor details table found for {make_filter} "
                 f"model {model_index}. "
@@ -821,17 +1130,17 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
 
         self.logger.info("Found tractor details table")
 
-        # Extract data from the table
-        # The table has rows with two cells: key and value
-        rows = details_table.css("tr")
+        # Count the rows of every matched table in libxml2 rather than
+        # building a selector per row
+        row_count = sum(int(_DETAILS_ROW_COUNT(table)) for table in details_tables)
 
-        if not rows or len(rows) == 0:
+        if row_count == 0:
             self.logger.warning(
                 f"Tractor details table is empty for {make_filter} model {model_index}"
             )
             return
 
-        self.logger.info(f"Found {len(rows)} rows in tractor details table")
+        self.logger.info(f"Found {row_count} rows in tractor details table")
 
         # Initialize item data
         item_data: dict[str, Any] = {
@@ -842,7 +1151,7 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
 
         # Extract model name from the first row or from selected option
         # Try to get the selected model name from the dropdown
-        model_name = response.css("#tractor-model option[selected]::text").get()
+        model_name = _first(_SELECTED_MODEL, root)
         if model_name:
             item_data["model"] = model_name.strip()
         else:
@@ -851,11 +1160,17 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
             item_data["model"] = f"Model_{fallback_index + 1}"
 
         # Parse each row for specifications
-        for row in rows:
-            cells = row.css("td")
-            if len(cells) >= 2:
-                key = cells[0].css("::text").get(default="").strip().lower()
-                value = cells[1].css("::text").get(default="").strip()
+        # The table has rows with two cells: key and value, so only rows with
+        # at least two cells are materialized
+        for table in details_tables:
+            for row in _DETAILS_ROWS(table):
+                # First text node of each cell in one query; a cell without
+                # text leaves fewer than two results and the row is skipped
+                texts = _KEY_VALUE_CELLS(row)
+                if len(texts) < 2:
+                    continue
+                key = texts[0].strip().lower()
+                value = texts[1].strip()
 
                 if key and value:
                     self._extract_spec_value(key, value, item_data)
@@ -877,33 +1192,36 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
             container: Scrapy selector for the container element
             item_data: Dictionary to populate with extracted specs
         """
+        self._extract_specs_from_root(container.root, item_data)
+
+    def _extract_specs_from_root(self, node: Any, item_data: dict[str, Any]) -> None:
+        """Extract specifications from a container's lxml element.
+
+        Args:
+            node: lxml element for the container
+            item_data: Dictionary to populate with extracted specs
+        """
         # Try different spec extraction patterns
         # Pattern 1: Definition list (dt/dd pairs)
-        spec_terms = container.css("dt")
-        if spec_terms:
-            for dt in spec_terms:
-                key = dt.css("::text").get(default="").strip().lower()
-                value = dt.xpath("following-sibling::dd[1]//text()").get(default="")
+        for dt in _TERMS(node):
+            # Term and definition text in one query; pairs missing either
+            # would be ignored by _extract_spec_value anyway
+            texts = _TERM_DEFINITION(dt)
+            if len(texts) < 2:
+                continue
 
-                self._extract_spec_value(key, value, item_data)
+            self._extract_spec_value(texts[0].strip().lower(), texts[1], item_data)
 
         # Pattern 2: Divs with class patterns
-        spec_items = container.css(".spec-item, .attribute-item")
-        for spec_item in spec_items:
-            key = (
-                spec_item.css(".label::text, .key::text")
-                .get(default="")
-                .strip()
-                .lower()
-            )
-            value = spec_item.css(".value::text, .val::text").get(default="")
+        for spec_item in _SPEC_ITEMS(node):
+            key = _first(_SPEC_ITEM_KEY, spec_item).strip().lower()
+            value = _first(_SPEC_ITEM_VALUE, spec_item)
 
             self._extract_spec_value(key, value, item_data)
 
         # Pattern 3: Table rows
-        rows = container.css("tr")
-        for row in rows:
-            cells = row.css("td::text").getall()
+        for row in _TABLE_ROWS(node):
+            cells = _CELL_TEXT(row)
             if len(cells) >= 2:
                 key = cells[0].strip().lower()
                 value = cells[1].strip()
@@ -923,37 +1241,20 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
         if not key or not value:
             return
 
-        value = value.strip()
-
-        # Map common spec keys to our data model
-        if "series" in key:
-            item_data["series"] = value
-        elif "engine" in key and "hp" in key:
-            try:
-                item_data["engine_hp"] = float(
-                    value.replace("HP", "").replace("hp", "").strip()
-                )
-            except ValueError:
-                pass
-        elif "pto" in key and "hp" in key:
-            try:
-                item_data["pto_hp"] = float(
-                    value.replace("HP", "").replace("hp", "").strip()
-                )
-            except ValueError:
-                pass
-        elif "weight" in key:
-            try:
-                item_data["weight_lbs"] = float(
-                    value.replace("lbs", "").replace(",", "").strip()
-                )
-            except ValueError:
-                pass
-        elif "transmission" in key:
-            item_data["transmission_type"] = value.strip().lower()
-        elif "model" in key and "model" not in item_data:
-            # Update model if found in attributes
-            item_data["model"] = value
+        # Common keys hit the exact-match table; anything else falls back to
+        # the ordered keyword rules
+        handler = _SPEC_HANDLERS.get(key)
+        if handler is None:
+            handler = next(
+                (
+                    rule_handler
+                    for keywords, rule_handler in _SPEC_RULES
+                    if all(keyword in key for keyword in keywords)
+                ),
+                None,
+            )
+        if handler is not None:
+            handler(value.strip(), item_data)
 
     def parse(self, response: Response) -> Iterator[dict[str, Any] | Any]:
         """Parse the main tractor specs page.
@@ -1000,26 +1301,43 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
                     )
             return
 
-        # Parse the filtered results
+        # Filtered page, or no target makes to fan out over: parse in place
+        if not isinstance(response, TextResponse):
+            self.logger.warning(f"Cannot parse non-text response from {response.url}")
+            return
+        yield from self._parse_listing(response)
+
+    def _parse_listing(self, response: TextResponse) -> Iterator[dict[str, Any] | Any]:
+        """Parse tractors from a listing page, trying each known layout in turn.
+
+        Items are yielded as they are parsed, so callers that only need the
+        first few results never pay for the rest of the page.
+
+        Args:
+            response: HTTP response from the tractor specs page
+
+        Yields:
+            Tractor specification items or requests for tractor detail pages
+        """
         # Strategy 1: If the page has a table of tractors
         # Look for common table structures
-        tractor_rows = response.css("table.specs-table tr") or response.css("table tr")
+        # Rows stay lxml elements; wrapping each one in a Selector is pure
+        # overhead since every row is read with a single compiled query
+        root = response.selector.root
+        tractor_rows = _SPECS_TABLE_ROWS(root) or _ANY_TABLE_ROWS(root)
 
         if tractor_rows:
             # Parse table-based layout
             yield from self._parse_table(response, tractor_rows)
         else:
             # Strategy 2: If the page has individual cards/sections
-            tractor_cards = response.css(".tractor-card, .product-card, .spec-item")
+            tractor_cards = _CARDS(root)
             if tractor_cards:
                 yield from self._parse_cards(response, tractor_cards)
             else:
                 # Strategy 3: Try to find any divs or sections with tractordata
                 # Look for common patterns in product listings
-                product_items = response.css(
-                    "div[class*='product'], div[class*='item'], "
-                    "div[class*='tractor'], li[class*='product']"
-                )
+                product_items = _PRODUCT_ITEMS(root)
                 if product_items:
                     self.logger.info(
                         f"Found {len(product_items)} potential product items"
@@ -1027,9 +1345,7 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
                     yield from self._parse_cards(response, product_items)
                 else:
                     # Strategy 4: Try to find links to individual tractor pages
-                    tractor_links = response.css(
-                        'a[href*="tractor"]::attr(href)'
-                    ).getall()
+                    tractor_links = _TRACTOR_LINKS(root)
                     if tractor_links:
                         self.logger.info(f"Found {len(tractor_links)} tractor links")
                         for link in tractor_links[:10]:  # Limit to first 10 for example
@@ -1037,10 +1353,14 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
                                 link, callback=self.parse_tractor_detail
                             )
                     else:
+                        # Only decode the logged prefix, not the whole body
+                        body_start = response.body[:500].decode(
+                            response.encoding or "utf-8", errors="replace"
+                        )
                         self.logger.warning(
                             f"No tractors found on page. "
                             f"Page might have different structure. "
-                            f"First 500 chars of body: {response.text[:500]}"
+                            f"First 500 bytes of body: {body_start}"
                         )
 
     def _parse_table(self, response: Response, rows: Any) -> Iterator[dict[str, Any]]:
@@ -1048,32 +1368,31 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
 
         Args:
             response: HTTP response
-            rows: Table row selectors
+            rows: Table row lxml elements
 
         Yields:
             Tractor items
         """
+        # Fields shared by every item on the page, copied into each row's item
+        base_item = {**self._BASE_ITEM, "source_url": response.url}
+
         # Skip header row(s)
         for row in rows[1:]:
             # Extract data from table cells
-            cells = row.css("td::text, td a::text").getall()
+            cells = _ROW_CELL_TEXT(row)
 
             if len(cells) >= 2:  # At least make and model
                 # Typical table format: Make | Model | Series | HP | etc.
-                make = cells[0].strip() if len(cells) > 0 else ""
-                model = cells[1].strip() if len(cells) > 1 else ""
+                make = cells[0].strip()
 
                 # Filter by target makes if specified
-                if self.target_makes and make not in self.target_makes:
+                if self.target_makes and make not in self._target_make_set:
                     continue
 
+                model = cells[1].strip()
+
                 # Extract other fields based on table structure
-                item_data: dict[str, Any] = {
-                    "make": make,
-                    "model": model,
-                    "category": EquipmentCategory.TRACTOR,
-                    "source_url": response.url,
-                }
+                item_data: dict[str, Any] = {**base_item, "make": make, "model": model}
 
                 # Try to extract additional fields
                 # (adjust indices based on actual table)
@@ -1097,19 +1416,27 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
 
         Args:
             response: HTTP response
-            cards: Card/section selectors
+            cards: Card/section lxml elements
 
         Yields:
             Tractor items
         """
-        for card in cards:
+        # Fields shared by every item on the page, copied into each card's item
+        base_item = {**self._BASE_ITEM, "source_url": response.url}
+
+        for node in cards:
             # Extract data from card structure
-            make = card.css(".make::text, .manufacturer::text").get(default="").strip()
-            model = card.css(".model::text, .model-name::text").get(default="").strip()
+            make = _first(_CARD_MAKE, node).strip()
+
+            # Skip non-target makes before any further selector work
+            if make and self.target_makes and make not in self._target_make_set:
+                continue
+
+            model = _first(_CARD_MODEL, node).strip()
 
             if not make or not model:
                 # Try alternative selectors
-                title = card.css("h2::text, h3::text, .title::text").get(default="")
+                title = _first(_CARD_TITLE, node)
                 if title:
                     # Try to parse "Make Model" format using helper
                     parsed = self._parse_make_model(title)
@@ -1118,23 +1445,18 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
 
             if make and model:
                 # Filter by target makes if specified
-                if self.target_makes and make not in self.target_makes:
+                if self.target_makes and make not in self._target_make_set:
                     continue
 
-                item_data: dict[str, Any] = {
-                    "make": make,
-                    "model": model,
-                    "category": EquipmentCategory.TRACTOR,
-                    "source_url": response.url,
-                }
+                item_data: dict[str, Any] = {**base_item, "make": make, "model": model}
 
                 # Extract additional specifications
-                series = card.css(".series::text").get()
+                series = _first(_CARD_SERIES, node)
                 if series:
                     item_data["series"] = series.strip()
 
                 # Try to extract HP values
-                hp_text = card.css(".horsepower::text, .hp::text").get()
+                hp_text = _first(_CARD_HP, node)
                 if hp_text:
                     try:
                         item_data["engine_hp"] = float(
@@ -1144,12 +1466,12 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
                         pass
 
                 # Extract description
-                description = card.css(".description::text, p::text").get()
+                description = _first(_CARD_DESCRIPTION, node)
                 if description:
                     item_data["description"] = description.strip()
 
                 # Extract image URL
-                image_url = card.css("img::attr(src)").get()
+                image_url = _first(_CARD_IMAGE, node)
                 if image_url:
                     item_data["image_url"] = response.urljoin(image_url)
 
@@ -1166,8 +1488,13 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
         """
         self.logger.info(f"Parsing tractor detail from {response.url}")
 
+        if not isinstance(response, TextResponse):
+            self.logger.warning(f"Cannot parse non-text response from {response.url}")
+            return
+
         # Extract make and model from page
-        title = response.css("h1::text, .product-title::text").get(default="")
+        root = response.selector.root
+        title = _first(_DETAIL_TITLE, root)
 
         parsed = self._parse_make_model(title)
         if not parsed:
@@ -1177,7 +1504,7 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
         make, model = parsed
 
         # Filter by target makes if specified
-        if self.target_makes and make not in self.target_makes:
+        if self.target_makes and make not in self._target_make_set:
             return
 
         item_data: dict[str, Any] = {
@@ -1189,34 +1516,32 @@ class QualityFarmSupplySpider(BaseEquipmentSpider):
 
         # Extract specifications from detail page
         # Common patterns: key-value pairs in a list or table
-        specs = response.css(".specs dl, .specifications dl")
-        if specs:
-            for dt in specs.css("dt"):
-                key = dt.css("::text").get(default="").strip().lower()
-                value = dt.xpath("following-sibling::dd[1]//text()").get(default="")
+        for dt in _DETAIL_SPEC_TERMS(root):
+            key = _first(_TERM_TEXT, dt).strip().lower()
+            value = _first(_DEFINITION_TEXT, dt)
 
-                if "engine" in key and "hp" in key:
-                    try:
-                        item_data["engine_hp"] = float(value.replace("HP", "").strip())
-                    except ValueError:
-                        pass
-                elif "pto" in key and "hp" in key:
-                    try:
-                        item_data["pto_hp"] = float(value.replace("HP", "").strip())
-                    except ValueError:
-                        pass
-                elif "weight" in key:
-                    try:
-                        item_data["weight_lbs"] = float(
-                            value.replace("lbs", "").replace(",", "").strip()
-                        )
-                    except ValueError:
-                        pass
-                elif "transmission" in key:
-                    item_data["transmission_type"] = value.strip().lower()
+            if "engine" in key and "hp" in key:
+                try:
+                    item_data["engine_hp"] = float(value.replace("HP", "").strip())
+                except ValueError:
+                    pass
+            elif "pto" in key and "hp" in key:
+                try:
+                    item_data["pto_hp"] = float(value.replace("HP", "").strip())
+                except ValueError:
+                    pass
+            elif "weight" in key:
+                try:
+                    item_data["weight_lbs"] = float(
+                        value.replace("lbs", "").replace(",", "").strip()
+                    )
+                except ValueError:
+                    pass
+            elif "transmission" in key:
+                item_data["transmission_type"] = value.strip().lower()
 
         # Extract image
-        image_url = response.css(".product-image img::attr(src)").get()
+        image_url = _first(_DETAIL_IMAGE, root)
         if image_url:
             item_data["image_url"] = response.urljoin(image_url)
 
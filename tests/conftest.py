@@ -0,0 +1,133 @@
+"""Shared pytest fixtures."""
+
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+from core.models import Combine, CommonEquipment, Implement, Sprayer, Tractor
+
+
+def pytest_addoption(parser):
+    """Add the opt-in flag for integration tests."""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="run tests marked integration (real crawls over the network)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+
+    skip_integration = pytest.mark.skip(reason="needs --run-integration to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pydantic_models():
+    """Validate and serialize one record per model before any test runs.
+
+    Keeps the first validation's one-off cost out of individual test
+    timings (e.g. ``pytest --durations``).
+    """
+    record = {"make": "x", "model": "x", "category": "other"}
+    CommonEquipment.__pydantic_validator__.validate_python(record).model_dump()
+    for model in (Tractor, Combine, Sprayer, Implement):
+        instance = model.__pydantic_validator__.validate_python(
+            {"make": "x", "model": "x"}
+        )
+        model.__pydantic_serializer__.to_python(instance)
+
+
+@pytest.fixture(scope="session")
+def project_root() -> Path:
+    """Get the project root directory."""
+    return Path(__file__).parent.parent
+
+
+@pytest.fixture(scope="session")
+def spider_names() -> set[str]:
+    """Names of the spiders found by the project's spider loader.
+
+    Runs the same lookup as 'scrapy list' once per session, in-process.
+    """
+    from scrapy.settings import Settings
+    from scrapy.spiderloader import SpiderLoader
+
+    from scrapers import settings
+
+    project_settings = Settings()
+    project_settings.setmodule(settings)
+    return set(SpiderLoader.from_settings(project_settings).list())
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a TestClient shared by the whole test session.
+
+    Entering the client runs the app lifespan once, so startup and shutdown
+    aren't repeated for every test.
+    """
+    from fastapi.testclient import TestClient
+
+    from api.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def make_request(client):
+    """Build bodiless requests for the shared client.
+
+    Returns a function taking ``(method, url)`` that builds a new
+    ``httpx.Request``, ready for ``client.send``. Only the resolved
+    ``(method, url)`` pair is cached: requests carry mutable headers and
+    streams, so sharing one between tests would leak changes across them.
+    """
+
+    @lru_cache(maxsize=None)
+    def resolve(method, url):
+        return method.upper(), client.base_url.join(url)
+
+    def build(method, url):
+        return client.build_request(*resolve(method, url))
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def parse_html():
+    """Return a helper that parses an HTML snippet into an lxml element.
+
+    One explicit lxml parser is shared by the whole session, and extractor
+    tests work on the element directly instead of a Scrapy response.
+    """
+    import lxml.html
+
+    parser = lxml.html.HTMLParser(remove_comments=True, remove_blank_text=True)
+
+    def parse(html):
+        return lxml.html.fromstring(html, parser=parser)
+
+    return parse
+
+
+@pytest.fixture
+async def async_client():
+    """Create an async client that calls the app in-process over ASGI."""
+    import httpx
+
+    from api.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as test_client:
+        yield test_client
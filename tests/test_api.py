@@ -1,78 +1,129 @@
 """Tests for the FastAPI application."""
 
-import json
-
-from fastapi.testclient import TestClient
-
-from api.main import app
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from api.main import ERROR_TABLES, EquipmentListParams
+from core.databricks_utils import TableManager, UnityCatalogConfig
+from core.models import Combine, Implement, Tractor
+from core.setup_tables import setup_error_table
+
+# (method, path, expected status, JSON body) for endpoints where only the
+# status code matters
+ENDPOINT_CASES = [
+    pytest.param("GET", "/equipment/nonexistent", 404, None, id="not-found"),
+    pytest.param("GET", "/docs", 200, None, id="openapi-docs"),
+    pytest.param("GET", "/docs/oauth2-redirect", 200, None, id="docs-oauth2-redirect"),
+    pytest.param("GET", "/equipment?limit=5&offset=10", 200, None, id="pagination"),
+    pytest.param("GET", "/equipment?limit=2000", 422, None, id="invalid-limit"),
+    pytest.param(
+        "DELETE",
+        "/errors/batch",
+        204,
+        {"ids": ["err_001", "err_002"]},
+        id="batch-delete-errors",
+    ),
+    pytest.param(
+        "DELETE", "/errors/batch", 400, {"ids": []}, id="batch-delete-empty-list"
+    ),
+    pytest.param(
+        "DELETE",
+        "/errors/batch",
+        422,
+        {"ids": [f"err_{i:03d}" for i in range(101)]},
+        id="batch-delete-too-many-ids",
+    ),
+]
+
+# Model behind each error table the API deletes from
+ERROR_TABLE_MODELS = {
+    "tractors_error": Tractor,
+    "combines_error": Combine,
+    "implements_error": Implement,
+}
+
+# Error record as written by the validation pipeline
+ERROR_RECORD = {
+    "id": "err_001",
+    "make": "John Deere",
+    "model": "5075E",
+    "category": "tractor",
+    "_validation_error": "engine_hp: Input should be greater than 0",
+    "_error_type": "ValidationError",
+}
+
+# Endpoints that return a JSON list
+LIST_ENDPOINTS = [
+    "/equipment",
+    "/equipment?category=tractor&make=John Deere&limit=10",
+    "/equipment/tractors",
+    "/equipment/combines",
+    "/equipment/implements",
+    "/errors",
+    "/errors?category=tractor",
+    "/errors?error_type=ValidationError",
+    "/errors?category=combine&error_type=ValueError",
+]
+
+
+@pytest.mark.parametrize(("method", "path", "status", "body"), ENDPOINT_CASES)
+def test_endpoint_status(client, method, path, status, body):
+    """Test that endpoints respond with the expected status code."""
+    response = client.request(method, path, json=body)
+    assert response.status_code == status
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param({"limit": 2000}, id="limit-too-large"),
+        pytest.param({"offset": -1}, id="negative-offset"),
+        pytest.param({"category": "spaceship"}, id="unknown-category"),
+    ],
+)
+def test_equipment_list_params_rejects_invalid(params):
+    """Test that invalid list query parameters fail validation."""
+    with pytest.raises(ValidationError):
+        EquipmentListParams(**params)
+
+
+async def test_list_endpoints(async_client):
+    """Test that listing endpoints (with and without filters) return lists."""
+    # The reads are independent, so issue them concurrently
+    responses = await asyncio.gather(
+        *(async_client.get(path) for path in LIST_ENDPOINTS)
+    )
 
-client = TestClient(app)
+    for response in responses:
+        assert response.status_code == 200
+        # Only the shape matters here, so check the JSON array brackets
+        # instead of decoding the body
+        assert response.headers["content-type"] == "application/json"
+        assert response.content[:1] == b"["
+        assert response.content[-1:] == b"]"
 
 
-def test_root_endpoint():
+def test_root_endpoint(client, make_request):
     """Test the root endpoint."""
-    response = client.get("/")
+    response = client.send(make_request("GET", "/"))
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
     assert "version" in data
 
 
-def test_health_check():
+def test_health_check(client, make_request):
     """Test the health check endpoint."""
-    response = client.get("/health")
+    response = client.send(make_request("GET", "/health"))
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
 
 
-def test_list_equipment():
-    """Test listing equipment."""
-    response = client.get("/equipment")
-    assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
-
-
-def test_list_equipment_with_filters():
-    """Test listing equipment with filters."""
-    response = client.get("/equipment?category=tractor&make=John Deere&limit=10")
-    assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
-
-
-def test_list_tractors():
-    """Test listing tractors."""
-    response = client.get("/equipment/tractors")
-    assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
-
-
-def test_list_combines():
-    """Test listing combines."""
-    response = client.get("/equipment/combines")
-    assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
-
-
-def test_list_implements():
-    """Test listing implements."""
-    response = client.get("/equipment/implements")
-    assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
-
-
-def test_get_equipment_not_found():
-    """Test getting non-existent equipment."""
-    response = client.get("/equipment/nonexistent")
-    assert response.status_code == 404
-
-
-def test_submit_contribution():
+def test_submit_contribution(client):
     """Test submitting a contribution."""
     contribution = {
         "field_name": "engine_hp",
@@ -86,9 +137,9 @@ def test_submit_contribution():
     assert data["status"] == "accepted"
 
 
-def test_get_statistics():
+def test_get_statistics(client, make_request):
     """Test getting database statistics."""
-    response = client.get("/stats")
+    response = client.send(make_request("GET", "/stats"))
     assert response.status_code == 200
     data = response.json()
     assert "total_equipment" in data
@@ -97,75 +148,56 @@ def test_get_statistics():
     assert "implements" in data
 
 
-def test_openapi_docs():
-    """Test that OpenAPI documentation is available."""
-    response = client.get("/docs")
-    assert response.status_code == 200
-
+@pytest.fixture
+def error_table_manager():
+    """Create a TableManager on an in-memory DuckDB database with error tables.
 
-def test_pagination():
-    """Test pagination parameters."""
-    response = client.get("/equipment?limit=5&offset=10")
-    assert response.status_code == 200
+    The connection is opened straight on DuckDB's default "memory" catalog, so
+    the Unity Catalog extensions are never loaded.
+    """
+    import duckdb
 
+    config = UnityCatalogConfig(
+        token="test", endpoint="http://test", catalog_name="memory", schema_name="main"
+    )
+    manager = TableManager(config)
+    manager._connection = duckdb.connect()
+    manager._initialized = True
+    for table_name, model_class in ERROR_TABLE_MODELS.items():
+        assert setup_error_table(manager, table_name, model_class)
 
-def test_invalid_limit():
-    """Test that invalid limit is rejected."""
-    response = client.get("/equipment?limit=2000")
-    assert response.status_code == 422  # Validation error
-
+    yield manager
 
-def test_list_error_records():
-    """Test listing error records."""
-    response = client.get("/errors")
-    assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
+    manager.close()
 
 
-def test_list_error_records_with_category_filter():
-    """Test listing error records filtered by category."""
-    response = client.get("/errors?category=tractor")
-    assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
+def test_error_table_models_cover_error_tables():
+    """Test that the DuckDB fixture creates every table the API deletes from."""
+    assert sorted(ERROR_TABLE_MODELS) == sorted(ERROR_TABLES)
 
 
-def test_list_error_records_with_error_type_filter():
-    """Test listing error records filtered by error type."""
-    response = client.get("/errors?error_type=ValidationError")
-    assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
+def test_batch_delete_errors_removes_records(client, error_table_manager):
+    """Test that a batch delete removes only the requested error records."""
+    error_table_manager.insert_records(
+        "tractors_error", [ERROR_RECORD, {**ERROR_RECORD, "id": "err_002"}]
+    )
 
+    with patch("api.main.get_unity_catalog_manager", return_value=error_table_manager):
+        response = client.request("DELETE", "/errors/batch", json={"ids": ["err_001"]})
 
-def test_list_error_records_with_multiple_filters():
-    """Test listing error records with multiple filters."""
-    response = client.get("/errors?category=combine&error_type=ValueError")
-    assert response.status_code == 200
-    data = response.json()
-    assert isinstance(data, list)
+    assert response.status_code == 204
+    remaining = error_table_manager.query_table("tractors_error")
+    assert [record["id"] for record in remaining] == ["err_002"]
 
 
-def test_batch_delete_errors():
-    """Test batch deleting error records."""
-    delete_request = {"ids": ["err_001", "err_002"]}
-    response = client.request(
-        "DELETE",
-        "/errors/batch",
-        content=json.dumps(delete_request),
-        headers={"Content-Type": "application/json"},
+def test_batch_delete_errors_reports_failed_delete(client, error_table_manager):
+    """Test that a delete failing on any error table is reported as an error."""
+    error_table_manager._get_connection().execute(
+        "DROP TABLE memory.main.implements_error"
     )
-    assert response.status_code == 204
 
+    with patch("api.main.get_unity_catalog_manager", return_value=error_table_manager):
+        response = client.request("DELETE", "/errors/batch", json={"ids": ["err_001"]})
 
-def test_batch_delete_errors_empty_list():
-    """Test that empty ID list is rejected."""
-    delete_request = {"ids": []}
-    response = client.request(
-        "DELETE",
-        "/errors/batch",
-        content=json.dumps(delete_request),
-        headers={"Content-Type": "application/json"},
-    )
-    assert response.status_code == 400
+    assert response.status_code == 500
+    assert "implements_error" in response.json()["detail"]
@@ -1,6 +1,7 @@
 """Tests for Unity Catalog utilities using DuckDB."""
 
-from unittest.mock import MagicMock, patch
+import sys
+from unittest.mock import Mock, patch
 
 import duckdb
 import pytest
@@ -14,6 +15,36 @@ from core.databricks_utils import (
 )
 
 
+class _FakeConn:
+    """Minimal stand-in for a DuckDB connection that records statements."""
+
+    description = [("col1",), ("col2",)]
+
+    def __init__(self):
+        self.executed = []
+        self.rows = []
+        self.registered = {}
+        self.unregistered = []
+        self.executemany = Mock()
+        self.close = Mock()
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        return self
+
+    def fetchall(self):
+        return self.rows
+
+    def cursor(self):
+        return self
+
+    def register(self, name, obj):
+        self.registered[name] = obj
+
+    def unregister(self, name):
+        self.unregistered.append(name)
+
+
 class TestIdentifierValidation:
     """Test identifier validation functions."""
 
@@ -52,6 +83,26 @@ class TestIdentifierValidation:
             _validate_sql_type("VARCHAR' OR '1'='1")
 
 
+def test_insert_records_mixed_types_into_duckdb():
+    """Test that raw records mixing "-5" and -5.0 reach a DOUBLE column."""
+    config = UnityCatalogConfig(
+        token="test", endpoint="http://test", catalog_name="memory", schema_name="main"
+    )
+    manager = TableManager(config)
+    manager._connection = duckdb.connect()
+    manager._initialized = True
+    manager.create_table("tractors_error", {"model": "VARCHAR", "engine_hp": "DOUBLE"})
+
+    manager.insert_records(
+        "tractors_error",
+        [{"model": "A", "engine_hp": -5.0}, {"model": "B", "engine_hp": "-5"}],
+    )
+
+    rows = manager.query_table("tractors_error")
+    manager.close()
+    assert [row["engine_hp"] for row in rows] == [-5.0, -5.0]
+
+
 class TestTableManager:
     """Test TableManager class."""
 
@@ -68,10 +119,15 @@ class TestTableManager:
 
     @pytest.fixture
     def mock_connection(self):
-        """Create a mock DuckDB connection."""
-        conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        conn.description = [("col1",), ("col2",)]
-        return conn
+        """Create a fake DuckDB connection."""
+        return _FakeConn()
+
+    @pytest.fixture(autouse=True)
+    def mock_connect(self, mock_connection):
+        """Patch duckdb.connect once per test to return the mock connection."""
+        with patch("core.databricks_utils.duckdb.connect") as mock_connect:
+            mock_connect.return_value = mock_connection
+            yield mock_connect
 
     def test_init(self, config):
         """Test TableManager initialization."""
@@ -80,12 +136,8 @@ class TestTableManager:
         assert manager._connection is None
         assert manager._initialized is False
 
-    @patch("core.databricks_utils.duckdb.connect")
     def test_get_connection_initializes_once(self, mock_connect, config):
         """Test that connection is initialized only once."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
-
         manager = TableManager(config)
         conn1 = manager._get_connection()
         conn2 = manager._get_connection()
@@ -93,69 +145,45 @@ class TestTableManager:
         assert conn1 is conn2
         mock_connect.assert_called_once()
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_create_table_validates_table_name(self, mock_connect, config):
+    def test_create_table_validates_table_name(self, config):
         """Test that create_table validates table name."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
-
         manager = TableManager(config)
 
         with pytest.raises(ValueError, match="Invalid table_name"):
             manager.create_table("invalid-name", {"col1": "VARCHAR"})
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_create_table_validates_column_names(self, mock_connect, config):
+    def test_create_table_validates_column_names(self, config):
         """Test that create_table validates column names."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
-
         manager = TableManager(config)
 
         with pytest.raises(ValueError, match="Invalid column name"):
             manager.create_table("valid_table", {"col-1": "VARCHAR"})
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_create_table_validates_sql_types(self, mock_connect, config):
+    def test_create_table_validates_sql_types(self, config):
         """Test that create_table validates SQL types."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
-
         manager = TableManager(config)
 
         with pytest.raises(ValueError, match="Invalid SQL type"):
             manager.create_table("valid_table", {"col1": "VARCHAR; DROP"})
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_insert_records_validates_table_name(self, mock_connect, config):
+    def test_insert_records_validates_table_name(self, config):
         """Test that insert_records validates table name."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
-
         manager = TableManager(config)
         records = [{"col1": "value1"}]
 
         with pytest.raises(ValueError, match="Invalid table_name"):
             manager.insert_records("invalid-name", records)
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_insert_records_validates_column_names(self, mock_connect, config):
+    def test_insert_records_validates_column_names(self, config):
         """Test that insert_records validates column names."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
-
         manager = TableManager(config)
         records = [{"col-1": "value1"}]
 
         with pytest.raises(ValueError, match="Invalid column name"):
             manager.insert_records("valid_table", records)
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_insert_records_validates_consistent_schema(self, mock_connect, config):
+    def test_insert_records_validates_consistent_schema(self, config):
         """Test that insert_records validates all records have same schema."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
-
         manager = TableManager(config)
         records = [
             {"col1": "value1", "col2": "value2"},
@@ -165,35 +193,105 @@ class TestTableManager:
         with pytest.raises(ValueError, match="inconsistent schema"):
             manager.insert_records("valid_table", records)
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_insert_records_empty_list(self, mock_connect, config):
+    def test_insert_records_empty_list(self, mock_connection, config):
         """Test that insert_records handles empty list."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
-
         manager = TableManager(config)
         manager.insert_records("valid_table", [])
 
         # Should not raise and should not call executemany
-        mock_conn.executemany.assert_not_called()
+        mock_connection.executemany.assert_not_called()
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_query_table_validates_table_name(self, mock_connect, config):
-        """Test that query_table validates table name."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
+    def test_insert_records_arrow_batch(self, mock_connection, config):
+        """Test that insert_records inserts one Arrow batch when available."""
+        pytest.importorskip("pyarrow")
+
+        manager = TableManager(config)
+        records = [
+            {"col1": "value1", "col2": 1},
+            {"col1": "value2", "col2": 2},
+        ]
+        manager.insert_records("valid_table", records)
+
+        batch = mock_connection.registered["_insert_batch"]
+        assert batch.to_pylist() == records
+        assert mock_connection.executed[-1] == (
+            "INSERT INTO test_catalog.test_schema.valid_table (col1, col2) "
+            "SELECT col1, col2 FROM _insert_batch",
+            None,
+        )
+        assert mock_connection.unregistered == ["_insert_batch"]
+        mock_connection.executemany.assert_not_called()
+
+    def test_insert_records_mixed_types_fall_back(self, mock_connection, config):
+        """Test that a batch Arrow cannot type is inserted with executemany."""
+        pytest.importorskip("pyarrow")
+
+        manager = TableManager(config)
+        records = [
+            {"col1": "value1", "col2": -5.0},
+            {"col1": "value2", "col2": "-5"},
+        ]
+        manager.insert_records("valid_table", records)
+
+        assert mock_connection.registered == {}
+        mock_connection.executemany.assert_called_once()
+        assert mock_connection.executemany.call_args[0][1] == [
+            ("value1", -5.0),
+            ("value2", "-5"),
+        ]
+
+    def test_insert_records_without_pyarrow(self, mock_connection, config):
+        """Test that insert_records uses executemany when pyarrow is missing."""
+        manager = TableManager(config)
+        records = [
+            {"col1": "value1", "col2": 1},
+            {"col1": "value2", "col2": 2},
+        ]
+
+        # A None entry makes "import pyarrow" raise ImportError
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            manager.insert_records("valid_table", records)
 
+        assert mock_connection.registered == {}
+        mock_connection.executemany.assert_called_once()
+        assert mock_connection.executemany.call_args[0][1] == [
+            ("value1", 1),
+            ("value2", 2),
+        ]
+
+    def test_delete_records_single_statement(self, mock_connection, config):
+        """Test that delete_records deletes a batch with one IN statement."""
+        manager = TableManager(config)
+        manager.delete_records("valid_table", "id", ["a", "b", "c"])
+
+        assert mock_connection.executed[-1] == (
+            "DELETE FROM test_catalog.test_schema.valid_table WHERE id IN (?, ?, ?)",
+            ["a", "b", "c"],
+        )
+
+    def test_delete_records_validates_column_name(self, config):
+        """Test that delete_records validates the column name."""
+        manager = TableManager(config)
+
+        with pytest.raises(ValueError, match="Invalid column name"):
+            manager.delete_records("valid_table", "id; DROP", ["a"])
+
+    def test_delete_records_empty_list(self, mock_connect, config):
+        """Test that delete_records does nothing for an empty list."""
+        manager = TableManager(config)
+        manager.delete_records("valid_table", "id", [])
+
+        mock_connect.assert_not_called()
+
+    def test_query_table_validates_table_name(self, config):
+        """Test that query_table validates table name."""
         manager = TableManager(config)
 
         with pytest.raises(ValueError, match="Invalid table_name"):
             manager.query_table("invalid-name")
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_query_table_validates_filter_keys(self, mock_connect, config):
+    def test_query_table_validates_filter_keys(self, config):
         """Test that query_table validates filter keys against schema."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
-
         # Mock get_table_schema to return specific columns
         with patch.object(TableManager, "get_table_schema") as mock_schema:
             mock_schema.return_value = {"col1": "VARCHAR", "col2": "INTEGER"}
@@ -203,12 +301,24 @@ class TestTableManager:
             with pytest.raises(ValueError, match="Invalid filter column"):
                 manager.query_table("valid_table", {"invalid_col": "value"})
 
-    @patch("core.databricks_utils.duckdb.connect")
-    def test_get_table_history_validates_limit(self, mock_connect, config):
-        """Test that get_table_history validates limit parameter."""
-        mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-        mock_connect.return_value = mock_conn
+    def test_get_table_schema_cached(self, mock_connection, config):
+        """Test that a table is only described once until invalidated."""
+        mock_connection.rows = [("col1", "VARCHAR"), ("col2", "INTEGER")]
 
+        manager = TableManager(config)
+        schema = manager.get_table_schema("valid_table")
+        assert manager.get_table_schema("valid_table") == schema
+        assert schema == {"col1": "VARCHAR", "col2": "INTEGER"}
+
+        describe = ("DESCRIBE test_catalog.test_schema.valid_table", None)
+        assert mock_connection.executed.count(describe) == 1
+
+        manager.invalidate_schema("valid_table")
+        manager.get_table_schema("valid_table")
+        assert mock_connection.executed.count(describe) == 2
+
+    def test_get_table_history_validates_limit(self, config):
+        """Test that get_table_history validates limit parameter."""
         manager = TableManager(config)
 
         with pytest.raises(ValueError, match="limit must be a positive integer"):
@@ -217,19 +327,15 @@ class TestTableManager:
         with pytest.raises(ValueError, match="limit must be a positive integer"):
             manager.get_table_history("valid_table", limit=0)
 
-    def test_close(self, config):
+    def test_close(self, mock_connection, config):
         """Test that close method properly closes connection."""
-        with patch("core.databricks_utils.duckdb.connect") as mock_connect:
-            mock_conn = MagicMock(spec=duckdb.DuckDBPyConnection)
-            mock_connect.return_value = mock_conn
-
-            manager = TableManager(config)
-            manager._get_connection()  # Initialize connection
-            manager.close()
+        manager = TableManager(config)
+        manager._get_connection()  # Initialize connection
+        manager.close()
 
-            mock_conn.close.assert_called_once()
-            assert manager._connection is None
-            assert manager._initialized is False
+        mock_connection.close.assert_called_once()
+        assert manager._connection is None
+        assert manager._initialized is False
 
 
 class TestGetTableManager:
@@ -247,47 +353,21 @@ class TestGetTableManager:
             with pytest.raises(ValueError, match="DATABRICKS_HOST"):
                 get_table_manager()
 
-    def test_endpoint_formatting_no_protocol(self):
-        """Test that endpoint without protocol is formatted correctly."""
-        with patch.dict(
-            "os.environ",
-            {
-                "DATABRICKS_TOKEN": "test_token",
-                "DATABRICKS_HOST": "example.com",
-            },
-        ):
-            manager = get_table_manager()
-            assert (
-                manager.config.endpoint == "https://example.com/api/2.1/unity-catalog"
-            )
-
-    def test_endpoint_formatting_with_protocol(self):
-        """Test that endpoint with protocol is formatted correctly."""
-        with patch.dict(
-            "os.environ",
-            {
-                "DATABRICKS_TOKEN": "test_token",
-                "DATABRICKS_HOST": "https://example.com",
-            },
-        ):
-            manager = get_table_manager()
-            assert (
-                manager.config.endpoint == "https://example.com/api/2.1/unity-catalog"
-            )
-
-    def test_endpoint_already_complete(self):
-        """Test that complete endpoint is not modified."""
-        with patch.dict(
-            "os.environ",
-            {
-                "DATABRICKS_TOKEN": "test_token",
-                "DATABRICKS_HOST": "https://example.com/api/2.1/unity-catalog",
-            },
-        ):
-            manager = get_table_manager()
-            assert (
-                manager.config.endpoint == "https://example.com/api/2.1/unity-catalog"
-            )
+    @pytest.mark.parametrize(
+        "host",
+        [
+            pytest.param("example.com", id="no-protocol"),
+            pytest.param("https://example.com", id="with-protocol"),
+            pytest.param("https://example.com/api/2.1/unity-catalog", id="complete"),
+        ],
+    )
+    def test_endpoint_formatting(self, monkeypatch, host):
+        """Test that the host is normalized to the Unity Catalog endpoint."""
+        monkeypatch.setenv("DATABRICKS_TOKEN", "test_token")
+        monkeypatch.setenv("DATABRICKS_HOST", host)
+
+        manager = get_table_manager()
+        assert manager.config.endpoint == "https://example.com/api/2.1/unity-catalog"
 
     def test_explicit_parameters(self):
         """Test that explicit parameters override environment variables."""
@@ -130,51 +130,32 @@ def test_sprayer_complete_attributes():
     assert sprayer.row_crop_capable is True
 
 
-def test_sprayer_negative_values():
-    """Test that sprayer validates negative values."""
-    with pytest.raises(ValidationError):
-        Sprayer(
-            make="Test",
-            model="Model",
-            tank_capacity_gal=-100,
-        )
-
-
-def test_sprayer_invalid_speed_range():
-    """Test that max speed cannot be less than min speed."""
-    with pytest.raises(ValidationError):
-        Sprayer(
-            make="Test",
-            model="Model",
-            ground_speed_mph_min=20.0,
-            ground_speed_mph_max=10.0,
-        )
-
-
-def test_sprayer_boom_width_limit():
-    """Test that boom width has reasonable upper limit."""
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"tank_capacity_gal": -100}, id="negative-tank-capacity"),
+        pytest.param(
+            {"ground_speed_mph_min": 20.0, "ground_speed_mph_max": 10.0},
+            id="max-speed-below-min",
+        ),
+        pytest.param({"boom_width_ft": 250}, id="boom-width-over-limit"),
+    ],
+)
+def test_sprayer_rejects_invalid_values(kwargs):
+    """Test that sprayer validation rejects out-of-range values."""
     with pytest.raises(ValidationError):
-        Sprayer(
-            make="Test",
-            model="Model",
-            boom_width_ft=250,  # Over 200 ft limit
-        )
+        Sprayer(make="Test", model="Model", **kwargs)
 
 
-def test_sprayer_boom_types():
+@pytest.mark.parametrize("boom_type", list(SprayerBoomType))
+def test_sprayer_boom_types(boom_type):
     """Test different boom type enums."""
-    for boom_type in [
-        SprayerBoomType.RIGID,
-        SprayerBoomType.FOLDING,
-        SprayerBoomType.TRUSS,
-        SprayerBoomType.HYBRID,
-    ]:
-        sprayer = Sprayer(
-            make="Test",
-            model="Model",
-            boom_type=boom_type,
-        )
-        assert sprayer.boom_type == boom_type
+    sprayer = Sprayer(
+        make="Test",
+        model="Model",
+        boom_type=boom_type,
+    )
+    assert sprayer.boom_type == boom_type
 
 
 def test_create_equipment_sprayer():
@@ -136,52 +136,60 @@ def test_invalid_hp_range():
         )
 
 
-def test_create_equipment_tractor():
-    """Test create_equipment factory function for tractor."""
-    data = {
-        "make": "New Holland",
-        "model": "T7.270",
-        "category": "tractor",
-        "engine_hp": 270,
-    }
-
-    equipment = create_equipment(data)
-
-    assert isinstance(equipment, Tractor)
-    assert equipment.make == "New Holland"
-    assert equipment.engine_hp == 270
-
-
-def test_create_equipment_combine():
-    """Test create_equipment factory function for combine."""
-    data = {
-        "make": "John Deere",
-        "model": "S780",
-        "category": "combine",
-        "grain_tank_capacity_bu": 400,
-    }
-
+@pytest.mark.parametrize(
+    ("data", "model_cls", "field", "value"),
+    [
+        pytest.param(
+            {
+                "make": "New Holland",
+                "model": "T7.270",
+                "category": "tractor",
+                "engine_hp": 270,
+            },
+            Tractor,
+            "engine_hp",
+            270,
+            id="tractor",
+        ),
+        pytest.param(
+            {
+                "make": "John Deere",
+                "model": "S780",
+                "category": "combine",
+                "grain_tank_capacity_bu": 400,
+            },
+            Combine,
+            "grain_tank_capacity_bu",
+            400,
+            id="combine",
+        ),
+        pytest.param(
+            {
+                "make": "Great Plains",
+                "model": "3P1006NT",
+                "category": "implement",
+                "working_width_ft": 10,
+            },
+            Implement,
+            "working_width_ft",
+            10,
+            id="implement",
+        ),
+    ],
+)
+def test_create_equipment(data, model_cls, field, value):
+    """Test create_equipment factory function for each category."""
     equipment = create_equipment(data)
 
-    assert isinstance(equipment, Combine)
-    assert equipment.make == "John Deere"
-    assert equipment.grain_tank_capacity_bu == 400
-
+    assert isinstance(equipment, model_cls)
+    assert equipment.make == data["make"]
+    assert getattr(equipment, field) == value
 
-def test_create_equipment_implement():
-    """Test create_equipment factory function for implement."""
-    data = {
-        "make": "Great Plains",
-        "model": "3P1006NT",
-        "category": "implement",
-        "working_width_ft": 10,
-    }
 
-    equipment = create_equipment(data)
-
-    assert isinstance(equipment, Implement)
-    assert equipment.make == "Great Plains"
-    assert equipment.working_width_ft == 10
+def test_create_equipment_unhashable_category():
+    """Test that an unhashable category is rejected as a validation error."""
+    with pytest.raises(ValidationError):
+        create_equipment({"make": "John Deere", "model": "8R", "category": ["tractor"]})
 
 
 def test_model_serialization():
@@ -0,0 +1,25 @@
+"""Guard against a test module being copied into a second location."""
+
+from collections import defaultdict
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+
+# Directories that may hold test modules; virtualenvs and caches are skipped
+SEARCH_DIRS = ("src", "tests")
+
+
+def test_no_test_module_defined_twice():
+    """Test that no test module file name appears in more than one directory.
+
+    Tests are imported with --import-mode=importlib, so a second copy of a
+    module (such as test_quality_farm_supply.py) is collected without any
+    error and runs every test twice on each CI run.
+    """
+    dirs_by_name = defaultdict(list)
+    for search_dir in SEARCH_DIRS:
+        for path in sorted((ROOT_DIR / search_dir).rglob("test_*.py")):
+            dirs_by_name[path.name].append(str(path.parent.relative_to(ROOT_DIR)))
+
+    duplicates = {name: dirs for name, dirs in dirs_by_name.items() if len(dirs) > 1}
+    assert not duplicates, f"Test modules defined in multiple places: {duplicates}"
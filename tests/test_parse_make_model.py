@@ -0,0 +1,64 @@
+"""Tests for make/model title parsing."""
+
+import pytest
+
+from scrapers.spiders._make_parser import parse_make_model
+
+MAKES = ("John Deere", "Case IH", "New Holland", "Kubota", "Massey Ferguson")
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        # Multi-word makes
+        pytest.param("John Deere 5075E", ("John Deere", "5075E"), id="john-deere"),
+        pytest.param("Case IH Farmall 75C", ("Case IH", "Farmall 75C"), id="case-ih"),
+        pytest.param("New Holland T4.75", ("New Holland", "T4.75"), id="new-holland"),
+        pytest.param(
+            "Massey Ferguson 1840M", ("Massey Ferguson", "1840M"), id="massey"
+        ),
+        # Single-word makes
+        pytest.param("Kubota M7-172", ("Kubota", "M7-172"), id="kubota"),
+        # Extra whitespace
+        pytest.param(
+            "  John Deere 5075E  ", ("John Deere", "5075E"), id="extra-whitespace"
+        ),
+    ],
+)
+def test_parse_make_model_known_makes(title, expected):
+    """Test parse_make_model with known manufacturer names."""
+    assert parse_make_model(title, MAKES) == expected
+
+
+def test_parse_make_model_unknown_makes():
+    """Test parse_make_model with unknown manufacturers (fallback behavior)."""
+    # Should fall back to splitting on first space
+    result = parse_make_model("UnknownBrand Model123", MAKES)
+    assert result == ("UnknownBrand", "Model123")
+
+
+def test_parse_make_model_prefers_longest_make():
+    """Test that the longest make leaving a model wins."""
+    makes = ("Case", "Case IH")
+
+    assert parse_make_model("Case IH Farmall 75C", makes) == ("Case IH", "Farmall 75C")
+    # "Case IH" would leave no model, so the shorter make is used
+    assert parse_make_model("Case IH", makes) == ("Case", "IH")
+
+
+def test_parse_make_model_without_makes():
+    """Test that an empty make list always uses the first-space split."""
+    assert parse_make_model("John Deere 5075E", ()) == ("John", "Deere 5075E")
+
+
+@pytest.mark.parametrize(
+    "title",
+    [
+        pytest.param("SingleWord", id="single-word"),
+        pytest.param("", id="empty"),
+        pytest.param("   ", id="whitespace-only"),
+    ],
+)
+def test_parse_make_model_invalid(title):
+    """Test parse_make_model with invalid input."""
+    assert parse_make_model(title, MAKES) is None
@@ -1,12 +1,13 @@
 """Tests for Scrapy pipelines and pipeline configuration."""
 
 import importlib
-from unittest.mock import Mock
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 from scrapy import Spider
 
 from core.models import EquipmentCategory
+from scrapers import settings
 from scrapers.pipelines import UnityCatalogWriterPipeline, ValidationPipeline
 
 
@@ -24,56 +25,54 @@ def mock_spider():
 
 
 @pytest.fixture
+def crawler(mock_spider):
+    """Create a minimal crawler stand-in exposing the mock spider."""
+    return SimpleNamespace(spider=mock_spider)
+
+
+@pytest.fixture(scope="module")
 def valid_tractor_item():
-    """Create a valid tractor item for testing."""
-    return {
-        "make": "John Deere",
-        "model": "5075E",
-        "category": "tractor",
-        "series": "5E Series",
-        "engine_hp": 75,
-        "pto_hp": 65,
-        "source_url": "https://example.com/tractor",
-    }
+    """Create a read-only valid tractor item for testing."""
+    return MappingProxyType(
+        {
+            "make": "John Deere",
+            "model": "5075E",
+            "category": "tractor",
+            "series": "5E Series",
+            "engine_hp": 75,
+            "pto_hp": 65,
+            "source_url": "https://example.com/tractor",
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def invalid_item():
-    """Create an invalid item for testing."""
-    return {
-        "make": "John Deere",
-        # Missing required 'model' field
-        "category": "tractor",
-    }
+    """Create a read-only invalid item for testing."""
+    return MappingProxyType(
+        {
+            "make": "John Deere",
+            # Missing required 'model' field
+            "category": "tractor",
+        }
+    )
 
 
 class TestValidationPipeline:
     """Tests for the ValidationPipeline."""
 
-    @pytest.fixture
-    def pipeline(self):
-        """Create a ValidationPipeline instance."""
-        return ValidationPipeline()
-
-    def test_process_valid_item(self, pipeline, mock_spider, valid_tractor_item):
-        """Test processing a valid item."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        result = pipeline.process_item(valid_tractor_item)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def pipeline(cls):
+        """Create a ValidationPipeline instance shared by the class.
 
-        # Should return validated item
-        assert result is not None
-        assert result["make"] == "John Deere"
-        assert result["model"] == "5075E"
-        assert result["category"] == EquipmentCategory.TRACTOR.value
+        The pipeline keeps no per-item state; each test sets its own crawler.
+        """
+        return ValidationPipeline()
 
-    def test_process_invalid_item(self, pipeline, mock_spider, invalid_item):
+    def test_process_invalid_item(self, pipeline, crawler, invalid_item):
         """Test processing an invalid item returns error item."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
+        pipeline.crawler = crawler
 
         result = pipeline.process_item(invalid_item)
 
@@ -82,15 +81,16 @@ class TestValidationPipeline:
         assert "_validation_error" in result
         assert "_error_type" in result
         assert result["_error_type"] == "ValidationError"
+        # Each error item gets its own record key
+        assert isinstance(result["id"], str)
+        assert result["id"]
         # Original data should be preserved
         assert result["make"] == "John Deere"
         assert result["category"] == "tractor"
 
-    def test_process_item_with_extra_fields(self, pipeline, mock_spider):
+    def test_process_item_with_extra_fields(self, pipeline, crawler):
         """Test that extra fields are handled correctly."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
+        pipeline.crawler = crawler
 
         item = {
             "make": "John Deere",
@@ -106,71 +106,89 @@ class TestValidationPipeline:
         assert result["make"] == "John Deere"
         assert result["model"] == "5075E"
 
-    def test_process_combine_item(self, pipeline, mock_spider):
-        """Test processing a combine harvester item."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        item = {
-            "make": "Case IH",
-            "model": "8250",
-            "category": "combine",
-            "separator_width_inches": 35,
-            "grain_tank_capacity_bu": 300,
-            "source_url": "https://example.com/combine",
-        }
+    @pytest.mark.parametrize(
+        ("item", "field", "value"),
+        [
+            pytest.param(
+                {
+                    "make": "John Deere",
+                    "model": "5075E",
+                    "category": "tractor",
+                    "series": "5E Series",
+                    "engine_hp": 75,
+                    "pto_hp": 65,
+                    "source_url": "https://example.com/tractor",
+                },
+                "engine_hp",
+                75,
+                id="tractor",
+            ),
+            pytest.param(
+                {
+                    "make": "Case IH",
+                    "model": "8250",
+                    "category": "combine",
+                    "separator_width_inches": 35,
+                    "grain_tank_capacity_bu": 300,
+                    "source_url": "https://example.com/combine",
+                },
+                "separator_width_inches",
+                35,
+                id="combine",
+            ),
+            pytest.param(
+                {
+                    "make": "John Deere",
+                    "model": "1890",
+                    "category": "implement",
+                    "working_width_ft": 60,
+                    "number_of_rows": 24,
+                    "source_url": "https://example.com/implement",
+                },
+                "working_width_ft",
+                60,
+                id="implement",
+            ),
+        ],
+    )
+    def test_process_valid_item(self, pipeline, crawler, item, field, value):
+        """Test processing a valid item for each equipment category."""
+        pipeline.crawler = crawler
 
         result = pipeline.process_item(item)
 
+        # Should return validated item
         assert result is not None
-        assert result["make"] == "Case IH"
-        assert result["category"] == EquipmentCategory.COMBINE.value
-        assert result["separator_width_inches"] == 35
-
-    def test_process_implement_item(self, pipeline, mock_spider):
-        """Test processing an implement item."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        item = {
-            "make": "John Deere",
-            "model": "1890",
-            "category": "implement",
-            "working_width_ft": 60,
-            "number_of_rows": 24,
-            "source_url": "https://example.com/implement",
-        }
-
-        result = pipeline.process_item(item)
-
-        assert result is not None
-        assert result["make"] == "John Deere"
-        assert result["category"] == EquipmentCategory.IMPLEMENT.value
-        assert result["working_width_ft"] == 60
+        assert result["make"] == item["make"]
+        assert result["model"] == item["model"]
+        assert result["category"] == EquipmentCategory(item["category"]).value
+        assert result[field] == value
 
 
 class TestUnityCatalogWriterPipeline:
     """Tests for the UnityCatalogWriterPipeline."""
 
     @pytest.fixture
-    def pipeline(self):
-        """Create a UnityCatalogWriterPipeline instance."""
-        return UnityCatalogWriterPipeline()
+    def pipeline(self, crawler):
+        """Create a UnityCatalogWriterPipeline that has already been opened."""
+        pipeline = UnityCatalogWriterPipeline()
+        pipeline.crawler = crawler
+        pipeline.open_spider()
+        return pipeline
 
-    def test_pipeline_initialization(self, pipeline):
+    def test_pipeline_initialization(self):
         """Test that pipeline initializes correctly."""
+        pipeline = UnityCatalogWriterPipeline()
+
         assert pipeline.items_buffer == []
         assert pipeline.error_items_buffer == []
         assert pipeline.buffer_size == 100
         assert pipeline.table_manager is None
 
-    def test_open_spider(self, pipeline, mock_spider):
+    def test_open_spider(self, crawler):
         """Test open_spider initialization."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
+        pipeline = UnityCatalogWriterPipeline()
+        pipeline.crawler = crawler
 
         pipeline.open_spider()
 
@@ -178,14 +196,8 @@ class TestUnityCatalogWriterPipeline:
         assert pipeline.items_buffer == []
         assert pipeline.error_items_buffer == []
 
-    def test_close_spider(self, pipeline, mock_spider):
+    def test_close_spider(self, pipeline):
         """Test close_spider cleanup."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        pipeline.open_spider()
-
         # Add some items to buffer
         pipeline.items_buffer = [{"test": "item"}]
 
@@ -194,16 +206,8 @@ class TestUnityCatalogWriterPipeline:
         # Buffer should be cleared after close
         assert len(pipeline.items_buffer) == 0
 
-    def test_process_item_adds_to_buffer(
-        self, pipeline, mock_spider, valid_tractor_item
-    ):
+    def test_process_item_adds_to_buffer(self, pipeline, valid_tractor_item):
         """Test that process_item adds items to buffer."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        pipeline.open_spider()
-
         result = pipeline.process_item(valid_tractor_item)
 
         # Should return the item unchanged
@@ -213,14 +217,8 @@ class TestUnityCatalogWriterPipeline:
         assert len(pipeline.items_buffer) == 1
         assert pipeline.items_buffer[0] == valid_tractor_item
 
-    def test_process_multiple_items(self, pipeline, mock_spider):
+    def test_process_multiple_items(self, pipeline):
         """Test processing multiple items."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        pipeline.open_spider()
-
         items = [
             {
                 "make": "John Deere",
@@ -237,13 +235,8 @@ class TestUnityCatalogWriterPipeline:
         # All items should be in buffer
         assert len(pipeline.items_buffer) == 5
 
-    def test_buffer_flush_on_close(self, pipeline, mock_spider, valid_tractor_item):
+    def test_buffer_flush_on_close(self, pipeline, valid_tractor_item):
         """Test that buffer is flushed when spider closes."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        pipeline.open_spider()
         pipeline.process_item(valid_tractor_item)
 
         # Buffer should have item
@@ -257,14 +250,8 @@ class TestUnityCatalogWriterPipeline:
         # write success
         assert len(pipeline.items_buffer) == 0
 
-    def test_process_error_item_adds_to_error_buffer(self, pipeline, mock_spider):
+    def test_process_error_item_adds_to_error_buffer(self, pipeline):
         """Test that error items are added to error buffer."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        pipeline.open_spider()
-
         # Create an error item
         error_item = {
             "make": "John Deere",
@@ -283,14 +270,8 @@ class TestUnityCatalogWriterPipeline:
         assert len(pipeline.items_buffer) == 0
         assert pipeline.error_items_buffer[0] == error_item
 
-    def test_error_buffer_flush_on_close(self, pipeline, mock_spider):
+    def test_error_buffer_flush_on_close(self, pipeline):
         """Test that error buffer is flushed when spider closes."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        pipeline.open_spider()
-
         error_item = {
             "make": "John Deere",
             "category": "tractor",
@@ -309,16 +290,8 @@ class TestUnityCatalogWriterPipeline:
         # After close, error buffer should be empty
         assert len(pipeline.error_items_buffer) == 0
 
-    def test_mixed_valid_and_error_items(
-        self, pipeline, mock_spider, valid_tractor_item
-    ):
+    def test_mixed_valid_and_error_items(self, pipeline, valid_tractor_item):
         """Test processing both valid and error items."""
-        # Set up the crawler attribute
-        pipeline.crawler = Mock()
-        pipeline.crawler.spider = mock_spider
-
-        pipeline.open_spider()
-
         # Process valid item
         pipeline.process_item(valid_tractor_item)
 
@@ -340,92 +313,84 @@ class TestUnityCatalogWriterPipeline:
         assert pipeline.error_items_buffer[0] == error_item
 
 
+@pytest.fixture(scope="session")
+def pipeline_config():
+    """Read ITEM_PIPELINES and locate the validation/writer priorities once."""
+    pipelines = settings.ITEM_PIPELINES
+    return {
+        "pipelines": pipelines,
+        "validation_priority": next(
+            (prio for path, prio in pipelines.items() if "ValidationPipeline" in path),
+            None,
+        ),
+        "writer_priority": next(
+            (prio for path, prio in pipelines.items() if "WriterPipeline" in path),
+            None,
+        ),
+    }
+
+
 class TestPipelineConfiguration:
     """Tests for pipeline configuration from settings."""
 
-    def test_pipeline_classes_are_importable(self):
-        """Test that all configured pipeline classes can be imported."""
-        # Import settings module
-        from scrapers import settings
-
-        # Get configured pipelines
-        pipelines = settings.ITEM_PIPELINES
+    @pytest.fixture(scope="class")
+    @classmethod
+    def resolved_pipelines(cls, pipeline_config):
+        """Import each configured pipeline module once for the whole class.
 
-        # Verify each pipeline class can be imported
-        for pipeline_path in pipelines.keys():
+        Returns:
+            List of (pipeline_path, module, class_name) tuples
+        """
+        resolved = []
+        for pipeline_path in pipeline_config["pipelines"]:
             module_path, class_name = pipeline_path.rsplit(".", 1)
-
-            # Import the module
             module = importlib.import_module(module_path)
+            resolved.append((pipeline_path, module, class_name))
+        return resolved
 
+    def test_pipeline_classes_are_importable(self, resolved_pipelines):
+        """Test that all configured pipeline classes can be imported."""
+        for pipeline_path, module, class_name in resolved_pipelines:
             # Verify the class exists
             assert hasattr(module, class_name), (
-                f"Module '{module_path}' does not have class '{class_name}'"
+                f"Module '{module.__name__}' does not have class '{class_name}'"
             )
 
-            # Get the class
-            pipeline_class = getattr(module, class_name)
-
             # Verify it's a class
+            pipeline_class = getattr(module, class_name)
             assert isinstance(pipeline_class, type), f"'{pipeline_path}' is not a class"
 
-    def test_validation_pipeline_is_configured(self):
+    def test_validation_pipeline_is_configured(self, pipeline_config):
         """Test that ValidationPipeline is in settings."""
-        from scrapers import settings
-
-        pipelines = settings.ITEM_PIPELINES
-
-        # Should have ValidationPipeline configured
-        assert any("ValidationPipeline" in path for path in pipelines.keys()), (
+        assert pipeline_config["validation_priority"] is not None, (
             "ValidationPipeline not found in ITEM_PIPELINES"
         )
 
-    def test_writer_pipeline_is_configured(self):
+    def test_writer_pipeline_is_configured(self, pipeline_config):
         """Test that a writer pipeline is configured."""
-        from scrapers import settings
-
-        pipelines = settings.ITEM_PIPELINES
-
         # Should have a writer pipeline (UnityCatalogWriterPipeline)
-        assert any("WriterPipeline" in path for path in pipelines.keys()), (
+        assert pipeline_config["writer_priority"] is not None, (
             "No WriterPipeline found in ITEM_PIPELINES"
         )
 
-    def test_pipeline_priorities_are_correct(self):
-        """Test that pipeline priorities are set correctly."""
-        from scrapers import settings
-
-        pipelines = settings.ITEM_PIPELINES
-
-        # ValidationPipeline should run first (lower priority number)
-        validation_priority = None
-        writer_priority = None
-
-        for path, priority in pipelines.items():
-            if "ValidationPipeline" in path:
-                validation_priority = priority
-            elif "WriterPipeline" in path:
-                writer_priority = priority
+    def test_pipeline_priorities_are_correct(self, pipeline_config):
+        """Test that ValidationPipeline runs before the writer pipeline."""
+        validation_priority = pipeline_config["validation_priority"]
+        writer_priority = pipeline_config["writer_priority"]
 
         # Both should be configured
         assert validation_priority is not None, "ValidationPipeline not configured"
         assert writer_priority is not None, "Writer pipeline not configured"
 
-        # Validation should run before writer
+        # Lower priority number runs first
         assert validation_priority < writer_priority, (
             "ValidationPipeline should have lower priority (run first) "
             "than WriterPipeline"
         )
 
-    def test_can_instantiate_all_pipelines(self):
+    def test_can_instantiate_all_pipelines(self, resolved_pipelines):
         """Test that all configured pipelines can be instantiated."""
-        from scrapers import settings
-
-        pipelines = settings.ITEM_PIPELINES
-
-        for pipeline_path in pipelines.keys():
-            module_path, class_name = pipeline_path.rsplit(".", 1)
-            module = importlib.import_module(module_path)
+        for pipeline_path, module, class_name in resolved_pipelines:
             pipeline_class = getattr(module, class_name)
 
             # Try to instantiate
@@ -1,24 +1,44 @@
 """Tests for the Quality Farm Supply spider."""
 
+import itertools
+import os
+import re
+import time
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
-from scrapy.http import HtmlResponse, Request
+from scrapy.http import HtmlResponse, Request, Response
 
 from core.models import EquipmentCategory
 from scrapers.spiders.quality_farm_supply import QualityFarmSupplySpider
 
+SPECS_URL = "https://www.qualityfarmsupply.com/pages/tractor-specs"
 
-@pytest.fixture
-def spider():
-    """Create a QualityFarmSupplySpider instance for testing."""
-    return QualityFarmSupplySpider()
 
+def compact_html(html):
+    """Drop the indentation between tags so lxml builds no blank text nodes."""
+    return re.sub(rb">\s+<", b"><", html).strip()
 
-@pytest.fixture
-def mock_response_table():
-    """Create a mock HTML response with table layout."""
-    html = """
+
+# Two-row make/model table shared by the target_makes tests
+SIMPLE_TABLE_HTML = compact_html(
+    b"""
+    <html>
+        <body>
+            <table class="specs-table">
+                <tr><th>Make</th><th>Model</th></tr>
+                <tr><td>John Deere</td><td>5075E</td></tr>
+                <tr><td>Case IH</td><td>Farmall 75C</td></tr>
+            </table>
+        </body>
+    </html>
+    """
+)
+
+# Specs table layout with two tractors
+TABLE_HTML = compact_html(
+    b"""
     <html>
         <body>
             <table class="specs-table">
@@ -47,15 +67,11 @@ def mock_response_table():
         </body>
     </html>
     """
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
-    request = Request(url=url, meta={"make_filter": "John Deere"})
-    return HtmlResponse(url=url, body=html, encoding="utf-8", request=request)
-
+)
 
-@pytest.fixture
-def mock_response_cards():
-    """Create a mock HTML response with card layout."""
-    html = """
+# Card layout with two tractors
+CARDS_HTML = compact_html(
+    b"""
     <html>
         <body>
             <div class="tractor-card">
@@ -74,9 +90,76 @@ def mock_response_cards():
         </body>
     </html>
     """
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
-    request = Request(url=url, meta={"make_filter": "John Deere"})
-    return HtmlResponse(url=url, body=html, encoding="utf-8", request=request)
+)
+
+# Tractor detail page with a definition-list spec block
+DETAIL_HTML = compact_html(
+    b"""
+    <html>
+        <body>
+            <h1 class="product-title">John Deere 5075E</h1>
+            <img class="product-image" src="/images/5075e.jpg" alt="5075E">
+            <div class="specs">
+                <dl>
+                    <dt>Engine HP</dt>
+                    <dd>75 HP</dd>
+                    <dt>PTO HP</dt>
+                    <dd>65 HP</dd>
+                    <dt>Weight</dt>
+                    <dd>7,700 lbs</dd>
+                    <dt>Transmission</dt>
+                    <dd>PowerShift</dd>
+                </dl>
+            </div>
+        </body>
+    </html>
+    """
+)
+
+# Detail page whose title has no make/model split
+INVALID_TITLE_HTML = compact_html(
+    b"""
+    <html>
+        <body>
+            <h1 class="product-title">InvalidTitle</h1>
+        </body>
+    </html>
+    """
+)
+
+
+def make_response(body, url=SPECS_URL, **meta):
+    """Build an HtmlResponse whose request carries the given meta."""
+    request = Request(url=url, meta=meta)
+    return HtmlResponse(url=url, body=body, encoding="utf-8", request=request)
+
+
+@pytest.fixture(scope="module")
+def spider():
+    """Create a QualityFarmSupplySpider instance shared by the module.
+
+    Tests that change spider attributes must do so through monkeypatch so
+    the shared instance is restored afterwards.
+    """
+    return QualityFarmSupplySpider()
+
+
+@pytest.fixture(scope="module")
+def mock_response_table():
+    """Create a mock HTML response with table layout."""
+    return make_response(TABLE_HTML, make_filter="John Deere")
+
+
+@pytest.fixture(scope="module")
+def mock_response_cards():
+    """Create a mock HTML response with card layout."""
+    return make_response(CARDS_HTML, make_filter="John Deere")
+
+
+@pytest.fixture(scope="module")
+def unfiltered_response():
+    """Create an empty specs page response with no make filter applied."""
+    return make_response(b"<html><body></body></html>")
 
 
 def test_spider_name(spider):
@@ -181,44 +264,114 @@ def test_parse_cards(spider, mock_response_cards):
     assert results[1]["model"] == "M7-172"
 
 
-def test_parse_without_filter_generates_requests(spider):
-    """Test that parse generates requests for each target make and model."""
-    html = "<html><body></body></html>"
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
-    # Create response without make_filter in meta
-    request = Request(url=url, meta={})
-    response = HtmlResponse(url=url, body=html, encoding="utf-8", request=request)
+def test_parse_product_items(spider):
+    """Test the generic product listing fallback."""
+    html = """
+    <html>
+        <body>
+            <li class="product-entry"><h3>John Deere 5075E</h3></li>
+            <div class="grid-item"><h3>Kubota M7-172</h3></div>
+            <div class="tractor-listing"><h3>Case IH Farmall 75C</h3></div>
+            <span class="product"><h3>New Holland T4.75</h3></span>
+        </body>
+    </html>
+    """
+    response = make_response(html, make_filter="John Deere")
 
     results = list(spider.parse(response))
 
-    # Should generate requests for each target make * 5 models (first 5 models per make)
-    expected_count = len(spider.target_makes) * 5
-    assert len(results) == expected_count
-
-    # Check that each result is a Request (not an item dict)
-    for result in results:
-        assert isinstance(result, Request)
+    assert [(item["make"], item["model"]) for item in results] == [
+        ("John Deere", "5075E"),
+        ("Kubota", "M7-172"),
+        ("Case IH", "Farmall 75C"),
+    ]
 
 
-def test_target_makes_filter(spider):
-    """Test that target_makes filtering works."""
-    # Set target makes to only include John Deere
-    spider.target_makes = ["John Deere"]
-
-    html = """
+def test_parse_follows_tractor_links(spider):
+    """Test the tractor link fallback when no listing entries are found."""
+    html = b"""
     <html>
         <body>
-            <table class="specs-table">
-                <tr><th>Make</th><th>Model</th></tr>
-                <tr><td>John Deere</td><td>5075E</td></tr>
-                <tr><td>Case IH</td><td>Farmall 75C</td></tr>
-            </table>
+            <a href="/tractors/john-deere-5075e">John Deere 5075E</a>
+            <a href="/about">About</a>
+            <a href="https://www.qualityfarmsupply.com/tractor/kubota-m7">M7</a>
         </body>
     </html>
     """
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
-    request = Request(url=url, meta={"make_filter": "John Deere"})
-    response = HtmlResponse(url=url, body=html, encoding="utf-8", request=request)
+    response = make_response(html, make_filter="John Deere")
+
+    results = list(spider.parse(response))
+
+    assert [result.url for result in results] == [
+        "https://www.qualityfarmsupply.com/tractors/john-deere-5075e",
+        "https://www.qualityfarmsupply.com/tractor/kubota-m7",
+    ]
+    assert all(result.callback == spider.parse_tractor_detail for result in results)
+
+
+def test_parse_skips_non_text_response(spider):
+    """Test that a filtered non-text response yields nothing."""
+    request = Request(url=SPECS_URL, meta={"make_filter": "John Deere"})
+    response = Response(url=SPECS_URL, body=b"\x89PNG", request=request)
+
+    assert next(spider.parse(response), None) is None
+
+
+def test_parse_logs_body_prefix_in_response_encoding(spider, caplog):
+    """Test that the no-tractors warning decodes the body with its encoding."""
+    request = Request(url=SPECS_URL, meta={"make_filter": "John Deere"})
+    response = HtmlResponse(
+        url=SPECS_URL,
+        body="<html><body><p>Caf\u00e9</p></body></html>".encode("cp1252"),
+        encoding="cp1252",
+        request=request,
+    )
+
+    assert next(spider.parse(response), None) is None
+    assert "First 500 bytes of body: <html><body><p>Caf\u00e9" in caplog.text
+
+
+def test_parse_without_filter_generates_requests(spider, unfiltered_response):
+    """Test that parse generates requests for each target make and model."""
+    pytest.importorskip("scrapy_playwright")
+
+    # Check each result is a Request (not an item dict) as it is yielded
+    count = 0
+    for result in spider.parse(unfiltered_response):
+        assert isinstance(result, Request)
+        count += 1
+
+    # Should generate requests for each target make * 5 models (first 5 models per make)
+    assert count == len(spider.target_makes) * 5
+
+
+def test_parse_without_filter_follows_target_make_order(spider, unfiltered_response):
+    """Test that the per-make requests fan out in target_makes order."""
+    pytest.importorskip("scrapy_playwright")
+
+    makes = [result.meta["make_filter"] for result in spider.parse(unfiltered_response)]
+
+    assert list(dict.fromkeys(makes)) == list(spider.target_makes)
+
+
+def test_parse_without_filter_is_lazy(spider, unfiltered_response):
+    """Test that parse yields requests lazily instead of building them all."""
+    pytest.importorskip("scrapy_playwright")
+
+    results = list(itertools.islice(spider.parse(unfiltered_response), 1))
+
+    assert len(results) == 1
+    assert isinstance(results[0], Request)
+    assert results[0].meta["model_index"] == 0
+
+
+def test_target_makes_filter(spider, monkeypatch):
+    """Test that target_makes filtering works."""
+    # Set target makes to only include John Deere
+    monkeypatch.setattr(spider, "target_makes", ("John Deere",))
+    monkeypatch.setattr(spider, "_target_make_set", frozenset(spider.target_makes))
+
+    response = make_response(SIMPLE_TABLE_HTML, make_filter="John Deere")
 
     results = list(spider.parse(response))
 
@@ -227,57 +380,23 @@ def test_target_makes_filter(spider):
     assert results[0]["make"] == "John Deere"
 
 
-def test_empty_target_makes(spider):
+def test_empty_target_makes(spider, monkeypatch):
     """Test with empty target_makes (should parse immediately)."""
-    spider.target_makes = []
+    monkeypatch.setattr(spider, "target_makes", ())
+    monkeypatch.setattr(spider, "_target_make_set", frozenset())
 
-    html = """
-    <html>
-        <body>
-            <table class="specs-table">
-                <tr><th>Make</th><th>Model</th></tr>
-                <tr><td>John Deere</td><td>5075E</td></tr>
-                <tr><td>Case IH</td><td>Farmall 75C</td></tr>
-            </table>
-        </body>
-    </html>
-    """
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
     # No make_filter in meta
-    request = Request(url=url, meta={})
-    response = HtmlResponse(url=url, body=html, encoding="utf-8", request=request)
+    response = make_response(SIMPLE_TABLE_HTML)
 
     # With empty target_makes, should parse immediately (no filter iteration)
-    results = list(spider.parse(response))
-
-    # Should get all tractors when target_makes is empty
-    assert len(results) == 2
+    # and get all tractors
+    assert sum(1 for _ in spider.parse(response)) == 2
 
 
 def test_parse_tractor_detail(spider):
     """Test parsing individual tractor detail page."""
-    html = """
-    <html>
-        <body>
-            <h1 class="product-title">John Deere 5075E</h1>
-            <img class="product-image" src="/images/5075e.jpg" alt="5075E">
-            <div class="specs">
-                <dl>
-                    <dt>Engine HP</dt>
-                    <dd>75 HP</dd>
-                    <dt>PTO HP</dt>
-                    <dd>65 HP</dd>
-                    <dt>Weight</dt>
-                    <dd>7,700 lbs</dd>
-                    <dt>Transmission</dt>
-                    <dd>PowerShift</dd>
-                </dl>
-            </div>
-        </body>
-    </html>
-    """
     url = "https://www.qualityfarmsupply.com/pages/tractor-specs/john-deere-5075e"
-    response = HtmlResponse(url=url, body=html, encoding="utf-8")
+    response = make_response(DETAIL_HTML, url=url)
 
     results = list(spider.parse_tractor_detail(response))
 
@@ -289,60 +408,57 @@ def test_parse_tractor_detail(spider):
 
 def test_parse_invalid_title(spider):
     """Test parsing with invalid/missing title."""
-    html = """
-    <html>
-        <body>
-            <h1 class="product-title">InvalidTitle</h1>
-        </body>
-    </html>
-    """
     url = "https://www.qualityfarmsupply.com/pages/tractor-specs/invalid"
-    response = HtmlResponse(url=url, body=html, encoding="utf-8")
-
-    results = list(spider.parse_tractor_detail(response))
+    response = make_response(INVALID_TITLE_HTML, url=url)
 
     # Should return nothing if title can't be parsed
-    assert len(results) == 0
+    assert next(spider.parse_tractor_detail(response), None) is None
 
 
-def test_parse_make_model_known_makes(spider):
-    """Test _parse_make_model with known manufacturer names."""
-    # Test multi-word makes
-    assert spider._parse_make_model("John Deere 5075E") == ("John Deere", "5075E")
-    assert spider._parse_make_model("Case IH Farmall 75C") == (
-        "Case IH",
-        "Farmall 75C",
-    )
-    assert spider._parse_make_model("New Holland T4.75") == ("New Holland", "T4.75")
+def test_parse_tractor_detail_skips_non_text_response(spider):
+    """Test that a non-text detail response yields nothing."""
+    url = "https://www.qualityfarmsupply.com/pages/tractor-specs/photo.png"
+    response = Response(url=url, body=b"\x89PNG", request=Request(url=url))
+
+    assert next(spider.parse_tractor_detail(response), None) is None
+
+
+def test_spider_parse_make_model_uses_known_makes(spider):
+    """Test that _parse_make_model matches against the spider's known makes."""
     assert spider._parse_make_model("Massey Ferguson 1840M") == (
         "Massey Ferguson",
         "1840M",
     )
 
-    # Test single-word makes
-    assert spider._parse_make_model("Kubota M7-172") == ("Kubota", "M7-172")
 
-    # Test with extra whitespace
-    assert spider._parse_make_model("  John Deere 5075E  ") == ("John Deere", "5075E")
+def test_parse_make_model_subclass_known_makes():
+    """Test that a subclass overriding known_makes gets its own lookup."""
+
+    class CustomMakesSpider(QualityFarmSupplySpider):
+        known_makes = ["Big Red Tractor Co"]
 
+    spider = CustomMakesSpider()
+
+    assert spider._parse_make_model("Big Red Tractor Co X1") == (
+        "Big Red Tractor Co",
+        "X1",
+    )
 
-def test_parse_make_model_unknown_makes(spider):
-    """Test _parse_make_model with unknown manufacturers (fallback behavior)."""
-    # Should fall back to splitting on first space
-    result = spider._parse_make_model("UnknownBrand Model123")
-    assert result == ("UnknownBrand", "Model123")
 
+def test_parse_makes_falls_back_to_playwright(spider):
+    """Test that a non-JSON makes response falls back to the Playwright flow."""
+    pytest.importorskip("scrapy_playwright")
 
-def test_parse_make_model_invalid(spider):
-    """Test _parse_make_model with invalid input."""
-    # Single word with no space
-    assert spider._parse_make_model("SingleWord") is None
+    url = "https://app.smalink.net/pim/tractor-specs.php"
+    response = make_response(b"<html><body></body></html>", url=url, api_params={})
 
-    # Empty string
-    assert spider._parse_make_model("") is None
+    results = list(spider.parse_makes(response))
 
-    # Only whitespace
-    assert spider._parse_make_model("   ") is None
+    assert len(results) == len(spider.start_urls)
+    for result in results:
+        assert isinstance(result, Request)
+        assert result.meta["playwright"] is True
+        assert result.callback == spider.parse
 
 
 def test_custom_settings_has_playwright(spider):
@@ -356,20 +472,24 @@ def test_custom_settings_has_playwright(spider):
 
 def test_make_playwright_request_without_filter(spider):
     """Test _make_playwright_request without make filter."""
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
+    pytest.importorskip("scrapy_playwright")
+
+    url = SPECS_URL
     request = spider._make_playwright_request(url, callback=spider.parse)
 
     assert request.url == url
     assert request.meta["playwright"] is True
     assert request.meta.get("make_filter") is None
-    assert len(request.meta["playwright_page_actions"]) > 0
+    assert len(request.meta["playwright_page_methods"]) > 0
     # Requests without make filters should use default duplicate filtering
     assert request.dont_filter is False
 
 
 def test_make_playwright_request_with_filter(spider):
     """Test _make_playwright_request with make filter."""
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
+    page = pytest.importorskip("scrapy_playwright.page")
+
+    url = SPECS_URL
     make = "John Deere"
     request = spider._make_playwright_request(url, callback=spider.parse, make=make)
 
@@ -377,41 +497,193 @@ def test_make_playwright_request_with_filter(spider):
     assert request.meta["playwright"] is True
     assert request.meta.get("make_filter") == make
     # Should have more actions when filtering by make
-    assert len(request.meta["playwright_page_actions"]) > 2
-    # Check that make name is in the actions (for filtering)
-    actions_str = str(request.meta["playwright_page_actions"])
-    assert make in actions_str
+    page_methods = request.meta["playwright_page_methods"]
+    assert len(page_methods) > 2
+    assert all(isinstance(method, page.PageMethod) for method in page_methods)
+    # Check that make name is passed to the actions (for filtering)
+    assert any(make in method.args for method in page_methods)
     # Requests with make filters should not be filtered as duplicates
     assert request.dont_filter is True
 
 
-def test_multiple_make_requests_not_filtered_as_duplicates(spider):
-    """Test that requests for different makes to the same URL are not filtered."""
-    html = "<html><body></body></html>"
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
-    # Create response without make_filter in meta
-    request = Request(url=url, meta={})
-    response = HtmlResponse(url=url, body=html, encoding="utf-8", request=request)
+def test_make_playwright_request_builds_page_methods_per_request(spider):
+    """Test that no PageMethod object is shared between requests.
 
-    results = list(spider.parse(response))
+    scrapy-playwright stores each method's result on the PageMethod, so
+    concurrent requests must not share them.
+    """
+    pytest.importorskip("scrapy_playwright")
+
+    first, second = (
+        spider._make_playwright_request(
+            SPECS_URL, callback=spider.parse_model_data, make="Kubota", model_index=0
+        )
+        for _ in range(2)
+    )
+
+    first_ids = {id(method) for method in first.meta["playwright_page_methods"]}
+    second_ids = {id(method) for method in second.meta["playwright_page_methods"]}
+    assert first_ids.isdisjoint(second_ids)
+
+
+def test_make_playwright_request_caches_static_assets(spider):
+    """Test that Playwright pages route static assets through the cache."""
+    pytest.importorskip("scrapy_playwright")
+
+    url = SPECS_URL
+    request = spider._make_playwright_request(url, callback=spider.parse)
+
+    assert request.meta["playwright_page_init_callback"] == spider._init_page
 
-    # Should generate requests for each target make * 5 models
-    expected_count = len(spider.target_makes) * 5
-    assert len(results) == expected_count
+
+ASSET_URL = "https://www.qualityfarmsupply.com/cdn/shop/t/1/assets/app.js?v=123"
+
+
+class _FakeAssetResponse:
+    """Stand-in for the APIResponse returned by Playwright's route.fetch()."""
+
+    ok = True
+    headers = {"content-type": "text/javascript", "content-encoding": "gzip"}
+
+    async def body(self):
+        return b"console.log('app');"
+
+
+class _NoStoreAssetResponse(_FakeAssetResponse):
+    """Asset response the server marks as not cacheable."""
+
+    headers = {"content-type": "text/javascript", "cache-control": "no-store"}
+
+
+class _FakeRoute:
+    """Stand-in for a Playwright route that records fetches and fulfills."""
+
+    def __init__(self, url, response_cls=_FakeAssetResponse):
+        self.request = SimpleNamespace(url=url)
+        self.response_cls = response_cls
+        self.fetches = 0
+        self.fulfilled = []
+
+    async def fetch(self):
+        self.fetches += 1
+        return self.response_cls()
+
+    async def fulfill(self, **kwargs):
+        self.fulfilled.append(kwargs)
+
+
+@pytest.mark.parametrize(
+    ("url", "matches"),
+    [
+        pytest.param(ASSET_URL, True, id="versioned-js"),
+        pytest.param("https://cdn.example.com/theme.css", True, id="plain-css"),
+        pytest.param("https://cdn.example.com/logo.webp#top", True, id="fragment"),
+        pytest.param(SPECS_URL, False, id="page"),
+        pytest.param("https://app.smalink.net/pim/a.json?x=.js", False, id="json"),
+    ],
+)
+def test_static_asset_pattern_ignores_query_string(spider, url, matches):
+    """Test that static assets are matched on their path alone."""
+    assert bool(spider.static_asset_pattern.search(url)) is matches
+
+
+async def test_serve_static_asset_miss_then_hit(spider, monkeypatch, tmp_path):
+    """Test that a fetched asset is stored and replayed from disk."""
+    monkeypatch.setattr(spider, "static_cache_dir", tmp_path)
+
+    miss = _FakeRoute(ASSET_URL)
+    await spider._serve_static_asset(miss)
+
+    assert miss.fetches == 1
+    assert miss.fulfilled[0]["body"] == b"console.log('app');"
+
+    hit = _FakeRoute(ASSET_URL)
+    await spider._serve_static_asset(hit)
+
+    assert hit.fetches == 0
+    assert hit.fulfilled == [
+        {
+            "body": b"console.log('app');",
+            # The body is stored decoded, so its encoding header is dropped
+            "headers": {"content-type": "text/javascript"},
+        }
+    ]
+
+
+async def test_serve_static_asset_refetches_expired(spider, monkeypatch, tmp_path):
+    """Test that a cache entry older than the TTL is fetched again."""
+    monkeypatch.setattr(spider, "static_cache_dir", tmp_path)
+    await spider._serve_static_asset(_FakeRoute(ASSET_URL))
+
+    expired = time.time() - spider.static_cache_ttl - 60
+    for path in tmp_path.iterdir():
+        os.utime(path, (expired, expired))
+
+    route = _FakeRoute(ASSET_URL)
+    await spider._serve_static_asset(route)
+
+    assert route.fetches == 1
+
+
+async def test_serve_static_asset_skips_no_store(spider, monkeypatch, tmp_path):
+    """Test that assets marked no-store are served but not written to disk."""
+    monkeypatch.setattr(spider, "static_cache_dir", tmp_path)
+
+    route = _FakeRoute(ASSET_URL, response_cls=_NoStoreAssetResponse)
+    await spider._serve_static_asset(route)
+
+    assert route.fulfilled[0]["body"] == b"console.log('app');"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sweep_static_cache_removes_expired_entries(spider, monkeypatch, tmp_path):
+    """Test that the cache sweep deletes expired entries and keeps fresh ones."""
+    monkeypatch.setattr(spider, "static_cache_dir", tmp_path)
+    stale = tmp_path / "stale"
+    fresh = tmp_path / "fresh"
+    stale.write_bytes(b"old")
+    fresh.write_bytes(b"new")
+    expired = time.time() - spider.static_cache_ttl - 60
+    os.utime(stale, (expired, expired))
+
+    spider._sweep_static_cache()
+
+    assert list(tmp_path.iterdir()) == [fresh]
+
+
+def test_sweep_static_cache_without_cache_dir(spider, monkeypatch, tmp_path):
+    """Test that sweeping before anything was cached is a no-op."""
+    monkeypatch.setattr(spider, "static_cache_dir", tmp_path / "missing")
+
+    spider._sweep_static_cache()
+
+    assert not (tmp_path / "missing").exists()
+
+
+def test_multiple_make_requests_not_filtered_as_duplicates(spider, unfiltered_response):
+    """Test that requests for different makes to the same URL are not filtered."""
+    pytest.importorskip("scrapy_playwright")
 
     # All requests should have dont_filter=True to avoid being filtered
-    for result in results:
+    count = 0
+    for result in spider.parse(unfiltered_response):
         assert isinstance(result, Request)
         assert result.dont_filter is True
         # Each request should have a make_filter and model_index
         assert result.meta.get("make_filter") in spider.target_makes
         assert result.meta.get("model_index") is not None
         assert 0 <= result.meta.get("model_index") < 5
+        count += 1
+
+    # Should generate requests for each target make * 5 models
+    assert count == len(spider.target_makes) * 5
 
 
 def test_make_playwright_request_with_model_index(spider):
     """Test _make_playwright_request with make and model index."""
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
+    pytest.importorskip("scrapy_playwright")
+
+    url = SPECS_URL
     make = "John Deere"
     model_index = 2
     request = spider._make_playwright_request(
@@ -423,17 +695,20 @@ def test_make_playwright_request_with_model_index(spider):
     assert request.meta.get("make_filter") == make
     assert request.meta.get("model_index") == model_index
     # Should have actions for both make and model selection
-    assert len(request.meta["playwright_page_actions"]) > 4
-    # Check that make name and model index are in the actions
-    actions_str = str(request.meta["playwright_page_actions"])
-    assert make in actions_str
-    assert str(model_index) in actions_str
+    page_methods = request.meta["playwright_page_methods"]
+    assert len(page_methods) > 4
+    # Check that make name and model index are passed to the actions
+    args = [arg for method in page_methods for arg in method.args]
+    assert make in args
+    assert model_index in args
     # Requests with model index should not be filtered as duplicates
     assert request.dont_filter is True
 
 
 def test_parse_model_data_with_attributes(spider):
     """Test parsing model-specific data with tractor details table."""
+    pytest.importorskip("scrapy_playwright")
+
     html = """
     <html>
         <body>
@@ -470,7 +745,7 @@ def test_parse_model_data_with_attributes(spider):
         </body>
     </html>
     """
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
+    url = SPECS_URL
 
     # Test using the spider's method to create request
     request = spider._make_playwright_request(
@@ -496,6 +771,26 @@ def test_parse_model_data_with_attributes(spider):
     assert results[0]["transmission_type"] == "powershift"
 
 
+def test_parse_model_data_counts_rows_across_matches(spider):
+    """Test that an empty first details match doesn't hide a later one."""
+    html = b"""
+    <html>
+        <body>
+            <div id="tractor-details"></div>
+            <table class="tractor-details-data">
+                <tr><td>Engine HP</td><td>75 HP</td></tr>
+            </table>
+        </body>
+    </html>
+    """
+    response = make_response(html, make_filter="John Deere", model_index=0)
+
+    results = list(spider.parse_model_data(response))
+
+    assert len(results) == 1
+    assert results[0]["engine_hp"] == 75.0
+
+
 def test_parse_model_data_missing_attributes_container(spider):
     """Test parsing model data when attributes container is missing."""
     html = """
@@ -507,14 +802,10 @@ def test_parse_model_data_missing_attributes_container(spider):
         </body>
     </html>
     """
-    url = "https://www.qualityfarmsupply.com/pages/tractor-specs"
-    request = Request(url=url, meta={"make_filter": "Kubota", "model_index": 1})
-    response = HtmlResponse(url=url, body=html, encoding="utf-8", request=request)
-
-    results = list(spider.parse_model_data(response))
+    response = make_response(html, make_filter="Kubota", model_index=1)
 
     # Should log warning and return no results when no attributes found
-    assert len(results) == 0
+    assert next(spider.parse_model_data(response), None) is None
 
 
 def test_extract_spec_value_various_formats(spider):
@@ -541,8 +832,8 @@ def test_extract_spec_value_various_formats(spider):
     assert item_data["series"] == "5E Series"
 
 
-def test_extract_specs_from_container_definition_list(spider):
-    """Test _extract_specs_from_container with definition list."""
+def test_extract_specs_from_root_definition_list(spider, parse_html):
+    """Test _extract_specs_from_root with definition list."""
     html = """
     <div class="specs">
         <dl>
@@ -553,18 +844,17 @@ def test_extract_specs_from_container_definition_list(spider):
         </dl>
     </div>
     """
-    response = HtmlResponse(url="http://test.com", body=html, encoding="utf-8")
-    container = response.css(".specs")
+    container = parse_html(html).find_class("specs")[0]
 
     item_data: dict[str, Any] = {}
-    spider._extract_specs_from_container(container[0], item_data)
+    spider._extract_specs_from_root(container, item_data)
 
     assert item_data["engine_hp"] == 75.0
     assert item_data["pto_hp"] == 65.0
 
 
-def test_extract_specs_from_container_table(spider):
-    """Test _extract_specs_from_container with table format."""
+def test_extract_specs_from_root_table(spider, parse_html):
+    """Test _extract_specs_from_root with table format."""
     html = """
     <div class="specifications">
         <table>
@@ -579,11 +869,10 @@ def test_extract_specs_from_container_table(spider):
         </table>
     </div>
     """
-    response = HtmlResponse(url="http://test.com", body=html, encoding="utf-8")
-    container = response.css(".specifications")
+    container = parse_html(html).find_class("specifications")[0]
 
     item_data: dict[str, Any] = {}
-    spider._extract_specs_from_container(container[0], item_data)
+    spider._extract_specs_from_root(container, item_data)
 
     assert item_data["engine_hp"] == 75.0
     assert item_data["weight_lbs"] == 7700.0
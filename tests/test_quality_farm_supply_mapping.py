@@ -1,47 +1,155 @@
 """Tests for Quality Farm Supply API response mapping."""
 
 import json
+from collections.abc import Callable
+from typing import Any, Final
 
 import pytest
 
 from core.models import EquipmentCategory
 from scrapers.spiders.quality_farm_supply import QualityFarmSupplySpider
 
+# API spec payloads arrive as JSON strings. Small payloads are written as JSON
+# literals; the complete response is encoded once at import
+COMPLETE_SPEC: Final = json.dumps(
+    {
+        "Years manufactured": "1987-1998",
+        "Hp pto": "17",
+        "Hp engine": "20",
+        "Engine make": "SHIBAURA",
+        "Engine fueld type": "DIESEL",
+        "Engine cylinders cid": "3/77.2",
+        "Transmission std": "CM",
+        "Fwd rev standard": "4/2",
+        "Wheelbase inches": "63",
+        "Pto speed": "540",
+        "Hitch lift": "1637",
+        "Hydraulics flow": "9.7",
+        "Weight": "2384",
+    }
+)
+
+RANGE_SPEC: Final = '{"Hp pto": "17-20", "Weight": "2300-2500"}'
+
+# Marks a field the mapping must leave out of the result
+MISSING = object()
+
+FIELD_CASES = [
+    pytest.param(
+        '{"Transmission std": "CM"}', "transmission_type", "manual", id="trans-CM"
+    ),
+    pytest.param(
+        '{"Transmission std": "HYDRO"}',
+        "transmission_type",
+        "hydrostatic",
+        id="trans-HYDRO",
+    ),
+    pytest.param(
+        '{"Transmission std": "HYDROSTAT"}',
+        "transmission_type",
+        "hydrostatic",
+        id="trans-HYDROSTAT",
+    ),
+    pytest.param(
+        '{"Transmission std": "PS"}', "transmission_type", "powershift", id="trans-PS"
+    ),
+    pytest.param(
+        '{"Transmission std": "CVT"}', "transmission_type", "cvt", id="trans-CVT"
+    ),
+    pytest.param(
+        '{"Transmission std": "IVT"}', "transmission_type", "ivt", id="trans-IVT"
+    ),
+    pytest.param(
+        '{"Fwd rev standard": "8F/4R"}', "forward_gears", 8, id="gears-f-r-forward"
+    ),
+    pytest.param(
+        '{"Fwd rev standard": "8F/4R"}', "reverse_gears", 4, id="gears-f-r-reverse"
+    ),
+    pytest.param(
+        '{"Fwd rev standard": "12/6"}', "forward_gears", 12, id="gears-slash-forward"
+    ),
+    pytest.param(
+        '{"Fwd rev standard": "12/6"}', "reverse_gears", 6, id="gears-slash-reverse"
+    ),
+    # Short concatenated (2-3 digits)
+    pytest.param(
+        '{"Fwd rev standard": "42"}', "forward_gears", 4, id="gears-concat-forward"
+    ),
+    pytest.param(
+        '{"Fwd rev standard": "42"}', "reverse_gears", 2, id="gears-concat-reverse"
+    ),
+    pytest.param(
+        '{"Years manufactured": "2005-2015"}', "year_start", 2005, id="years-start"
+    ),
+    pytest.param(
+        '{"Years manufactured": "2005-2015"}', "year_end", 2015, id="years-end"
+    ),
+    pytest.param(
+        '{"Years manufactured": "2020"}', "year_start", 2020, id="year-single"
+    ),
+    pytest.param(
+        '{"Years manufactured": "2020"}', "year_end", MISSING, id="year-single-no-end"
+    ),
+    # Ranges take their first value
+    pytest.param(RANGE_SPEC, "pto_hp", 17.0, id="range-pto-hp"),
+    pytest.param(RANGE_SPEC, "weight_lbs", 2300.0, id="range-weight"),
+]
+
+NULL_SPEC: Final = (
+    '{"Hp pto": null, "Hp engine": "null", "Weight": "", "Transmission std": "null"}'
+)
+
+NUMERIC_SPEC: Final = (
+    '{"Hp pto": "25.5 HP", "Hp engine": "30", "Weight": "3,450 lbs", '
+    '"Wheelbase inches": "72.5 in", "Hitch lift": "2000"}'
+)
+
+
+MapFn = Callable[[dict[str, Any], str, str, str], dict[str, Any]]
+MapSpec = Callable[[str], dict[str, Any]]
+
+
+@pytest.fixture(scope="session")
+def spider() -> QualityFarmSupplySpider:
+    """Create a spider instance shared by the session.
+
+    The mapping tests only call _map_api_response_to_tractor, which does
+    not touch spider state.
+    """
+    return QualityFarmSupplySpider()
+
+
+@pytest.fixture(scope="session")
+def map_fn(spider: QualityFarmSupplySpider) -> MapFn:
+    """Return the spider's bound API mapping method."""
+    return spider._map_api_response_to_tractor
+
+
+@pytest.fixture(scope="session")
+def map_spec(map_fn: MapFn) -> MapSpec:
+    """Return a function mapping an encoded spec for a placeholder tractor.
+
+    Wraps the spec in an API response and maps it as make "Test", model
+    "Model", so tests only supply the payload.
+    """
+
+    def _map_spec(spec: str) -> dict[str, Any]:
+        return map_fn({"spec": spec}, "Test", "Model", "https://example.com")
+
+    return _map_spec
+
 
 class TestAPIMapping:
     """Test the API response to Tractor model mapping."""
 
-    @pytest.fixture
-    def spider(self) -> QualityFarmSupplySpider:
-        """Create a spider instance."""
-        return QualityFarmSupplySpider()
-
-    def test_map_complete_api_response(self, spider: QualityFarmSupplySpider) -> None:
+    def test_map_complete_api_response(self, map_fn: MapFn) -> None:
         """Test mapping a complete API response."""
         api_data = {
-            "spec": json.dumps(
-                {
-                    "Years manufactured": "1987-1998",
-                    "Hp pto": "17",
-                    "Hp engine": "20",
-                    "Engine make": "SHIBAURA",
-                    "Engine fueld type": "DIESEL",
-                    "Engine cylinders cid": "3/77.2",
-                    "Transmission std": "CM",
-                    "Fwd rev standard": "4/2",
-                    "Wheelbase inches": "63",
-                    "Pto speed": "540",
-                    "Hitch lift": "1637",
-                    "Hydraulics flow": "9.7",
-                    "Weight": "2384",
-                }
-            ),
+            "spec": COMPLETE_SPEC,
             "serial": [["UE24511", "1990", "LEFT SIDE OF TRANS HOUSING"]],
         }
 
-        result = spider._map_api_response_to_tractor(
-            api_data, "Kubota", "B7200HST", "https://example.com"
-        )
+        result = map_fn(api_data, "Kubota", "B7200HST", "https://example.com")
 
         assert result["make"] == "Kubota"
         assert result["model"] == "B7200HST"
@@ -61,71 +169,17 @@ class TestAPIMapping:
         assert "DIESEL" in result["description"]
         assert "540" in result["description"]
 
-    def test_map_transmission_types(self, spider: QualityFarmSupplySpider) -> None:
-        """Test mapping various transmission type codes."""
-        test_cases = [
-            ("CM", "manual"),
-            ("HYDRO", "hydrostatic"),
-            ("HYDROSTAT", "hydrostatic"),
-            ("PS", "powershift"),
-            ("CVT", "cvt"),
-            ("IVT", "ivt"),
-        ]
-
-        for trans_code, expected_type in test_cases:
-            api_data = {
-                "spec": json.dumps(
-                    {
-                        "Transmission std": trans_code,
-                    }
-                )
-            }
-            result = spider._map_api_response_to_tractor(
-                api_data, "Test", "Model", "https://example.com"
-            )
-            assert result["transmission_type"] == expected_type
-
-    def test_map_gear_formats(self, spider: QualityFarmSupplySpider) -> None:
-        """Test mapping various gear format patterns."""
-        # Pattern: "F/R" format
-        api_data = {"spec": json.dumps({"Fwd rev standard": "8F/4R"})}
-        result = spider._map_api_response_to_tractor(
-            api_data, "Test", "Model", "https://example.com"
-        )
-        assert result["forward_gears"] == 8
-        assert result["reverse_gears"] == 4
-
-        # Pattern: slash-separated
-        api_data = {"spec": json.dumps({"Fwd rev standard": "12/6"})}
-        result = spider._map_api_response_to_tractor(
-            api_data, "Test", "Model", "https://example.com"
-        )
-        assert result["forward_gears"] == 12
-        assert result["reverse_gears"] == 6
-
-        # Pattern: short concatenated (2-3 digits)
-        api_data = {"spec": json.dumps({"Fwd rev standard": "42"})}
-        result = spider._map_api_response_to_tractor(
-            api_data, "Test", "Model", "https://example.com"
-        )
-        assert result["forward_gears"] == 4
-        assert result["reverse_gears"] == 2
+    @pytest.mark.parametrize(("spec", "field", "expected"), FIELD_CASES)
+    def test_map_single_field(
+        self, map_spec: MapSpec, spec: str, field: str, expected: object
+    ) -> None:
+        """Test transmission, gear, year and range values map to their field."""
+        result = map_spec(spec)
+        assert result.get(field, MISSING) == expected
 
-    def test_map_null_values(self, spider: QualityFarmSupplySpider) -> None:
+    def test_map_null_values(self, map_spec: MapSpec) -> None:
         """Test that null values are handled correctly."""
-        api_data = {
-            "spec": json.dumps(
-                {
-                    "Hp pto": None,
-                    "Hp engine": "null",
-                    "Weight": "",
-                    "Transmission std": "null",
-                }
-            )
-        }
-        result = spider._map_api_response_to_tractor(
-            api_data, "Test", "Model", "https://example.com"
-        )
+        result = map_spec(NULL_SPEC)
 
         # Should not have these fields if they're null
         assert "pto_hp" not in result
@@ -133,22 +187,9 @@ class TestAPIMapping:
         assert "weight_lbs" not in result
         assert "transmission_type" not in result
 
-    def test_map_numeric_extraction(self, spider: QualityFarmSupplySpider) -> None:
+    def test_map_numeric_extraction(self, map_spec: MapSpec) -> None:
         """Test extraction of numeric values with various formats."""
-        api_data = {
-            "spec": json.dumps(
-                {
-                    "Hp pto": "25.5 HP",
-                    "Hp engine": "30",
-                    "Weight": "3,450 lbs",
-                    "Wheelbase inches": "72.5 in",
-                    "Hitch lift": "2000",
-                }
-            )
-        }
-        result = spider._map_api_response_to_tractor(
-            api_data, "Test", "Model", "https://example.com"
-        )
+        result = map_spec(NUMERIC_SPEC)
 
         assert result["pto_hp"] == 25.5
         assert result["engine_hp"] == 30.0
@@ -156,52 +197,11 @@ class TestAPIMapping:
         assert result["wheelbase_inches"] == 72.5
         assert result["hitch_lift_capacity"] == 2000.0
 
-    def test_map_year_range(self, spider: QualityFarmSupplySpider) -> None:
-        """Test extraction of year ranges."""
-        # Normal range
-        api_data = {"spec": json.dumps({"Years manufactured": "2005-2015"})}
-        result = spider._map_api_response_to_tractor(
-            api_data, "Test", "Model", "https://example.com"
-        )
-        assert result["year_start"] == 2005
-        assert result["year_end"] == 2015
-
-        # Single year
-        api_data = {"spec": json.dumps({"Years manufactured": "2020"})}
-        result = spider._map_api_response_to_tractor(
-            api_data, "Test", "Model", "https://example.com"
-        )
-        assert result["year_start"] == 2020
-        assert "year_end" not in result
-
-    def test_map_invalid_json_spec(self, spider: QualityFarmSupplySpider) -> None:
+    def test_map_invalid_json_spec(self, map_spec: MapSpec) -> None:
         """Test handling of invalid JSON in spec field."""
-        api_data = {
-            "spec": "invalid json {{{",
-        }
-        result = spider._map_api_response_to_tractor(
-            api_data, "Test", "Model", "https://example.com"
-        )
+        result = map_spec("invalid json {{{")
 
         # Should still return basic fields
         assert result["make"] == "Test"
         assert result["model"] == "Model"
         assert result["category"] == EquipmentCategory.TRACTOR
-
-    def test_map_range_values(self, spider: QualityFarmSupplySpider) -> None:
-        """Test handling of range values (takes first value)."""
-        api_data = {
-            "spec": json.dumps(
-                {
-                    "Hp pto": "17-20",
-                    "Weight": "2300-2500",
-                }
-            )
-        }
-        result = spider._map_api_response_to_tractor(
-            api_data, "Test", "Model", "https://example.com"
-        )
-
-        # Should take first value from range
-        assert result["pto_hp"] == 17.0
-        assert result["weight_lbs"] == 2300.0
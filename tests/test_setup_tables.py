@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
 from pydantic import Field
 
 from core.models import Combine, Implement, Sprayer, Tractor
@@ -13,6 +14,24 @@ from core.setup_tables import (
     setup_table,
 )
 
+# setup_table results for the partial-failure test: the second table fails
+PARTIAL_SETUP_RESULTS = (True, False, True, True)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _silence_setup_logger():
+    """Patch the setup script's logger once for the whole module."""
+    with patch("core.setup_tables.logger"):
+        yield
+
+
+@pytest.fixture
+def table_manager():
+    """Create a mock TableManager whose create_table succeeds."""
+    manager = MagicMock()
+    manager.create_table.return_value = None
+    return manager
+
 
 class TestPydanticToSqlType:
     """Tests for pydantic_to_sql_type function."""
@@ -90,31 +109,32 @@ class TestGetSchemaFromModel:
         assert "working_width_ft" in schema
         assert "required_hp_min" in schema
 
+    def test_schema_copies_are_independent(self):
+        """Test that changing a returned schema doesn't affect later calls."""
+        schema = get_schema_from_model(Tractor)
+        schema["_error_type"] = "VARCHAR"
+
+        assert "_error_type" not in get_schema_from_model(Tractor)
+
 
 class TestSetupTable:
     """Tests for setup_table function."""
 
-    @patch("core.setup_tables.logger")
-    def test_setup_table_success(self, mock_logger):
+    def test_setup_table_success(self, table_manager):
         """Test successful table setup."""
-        mock_table_manager = MagicMock()
-        mock_table_manager.create_table.return_value = None
-
-        result = setup_table(mock_table_manager, "test_table", Tractor)
+        result = setup_table(table_manager, "test_table", Tractor)
 
         assert result is True
-        mock_table_manager.create_table.assert_called_once()
-        call_args = mock_table_manager.create_table.call_args
+        table_manager.create_table.assert_called_once()
+        call_args = table_manager.create_table.call_args
         assert call_args[0][0] == "test_table"
         assert isinstance(call_args[0][1], dict)
 
-    @patch("core.setup_tables.logger")
-    def test_setup_table_failure(self, mock_logger):
+    def test_setup_table_failure(self, table_manager):
         """Test table setup failure handling."""
-        mock_table_manager = MagicMock()
-        mock_table_manager.create_table.side_effect = Exception("Connection error")
+        table_manager.create_table.side_effect = Exception("Connection error")
 
-        result = setup_table(mock_table_manager, "test_table", Tractor)
+        result = setup_table(table_manager, "test_table", Tractor)
 
         assert result is False
 
@@ -122,36 +142,29 @@ class TestSetupTable:
 class TestSetupErrorTable:
     """Tests for setup_error_table function."""
 
-    @patch("core.setup_tables.logger")
-    def test_setup_error_table_success(self, mock_logger):
+    def test_setup_error_table_success(self, table_manager):
         """Test successful error table setup."""
-        mock_table_manager = MagicMock()
-        mock_table_manager.create_table.return_value = None
-
-        result = setup_error_table(mock_table_manager, "tractors_error", Tractor)
+        result = setup_error_table(table_manager, "tractors_error", Tractor)
 
         assert result is True
-        mock_table_manager.create_table.assert_called_once()
-        call_args = mock_table_manager.create_table.call_args
+        table_manager.create_table.assert_called_once()
+        call_args = table_manager.create_table.call_args
         assert call_args[0][0] == "tractors_error"
         schema = call_args[0][1]
         assert isinstance(schema, dict)
-        # Verify error fields are present
+        # Verify the record key and error fields are present
+        assert schema["id"] == "VARCHAR"
         assert "_validation_error" in schema
         assert "_error_type" in schema
         assert schema["_validation_error"] == "VARCHAR"
         assert schema["_error_type"] == "VARCHAR"
 
-    @patch("core.setup_tables.logger")
-    def test_setup_error_table_has_base_schema(self, mock_logger):
+    def test_setup_error_table_has_base_schema(self, table_manager):
         """Test that error table includes base model schema."""
-        mock_table_manager = MagicMock()
-        mock_table_manager.create_table.return_value = None
-
-        result = setup_error_table(mock_table_manager, "combines_error", Combine)
+        result = setup_error_table(table_manager, "combines_error", Combine)
 
         assert result is True
-        call_args = mock_table_manager.create_table.call_args
+        call_args = table_manager.create_table.call_args
         schema = call_args[0][1]
         # Verify some base fields are present
         assert "make" in schema
@@ -161,13 +174,11 @@ class TestSetupErrorTable:
         assert "_validation_error" in schema
         assert "_error_type" in schema
 
-    @patch("core.setup_tables.logger")
-    def test_setup_error_table_failure(self, mock_logger):
+    def test_setup_error_table_failure(self, table_manager):
         """Test error table setup failure handling."""
-        mock_table_manager = MagicMock()
-        mock_table_manager.create_table.side_effect = Exception("Connection error")
+        table_manager.create_table.side_effect = Exception("Connection error")
 
-        result = setup_error_table(mock_table_manager, "tractors_error", Tractor)
+        result = setup_error_table(table_manager, "tractors_error", Tractor)
 
         assert result is False
 
@@ -205,8 +216,7 @@ class TestSetupAllTables:
         """Test when some tables fail to setup."""
         mock_table_manager = MagicMock()
         mock_get_table_manager.return_value = mock_table_manager
-        # First table succeeds, second fails, etc.
-        mock_setup_table.side_effect = [True, False, True, True]
+        mock_setup_table.side_effect = iter(PARTIAL_SETUP_RESULTS)
         mock_setup_error_table.return_value = True
 
         result = setup_all_tables()
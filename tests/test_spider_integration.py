@@ -8,20 +8,48 @@ These tests actually run the spiders with limited crawling to verify:
 """
 
 import inspect
+import re
 import subprocess
 from pathlib import Path
 
 import pytest
 
+from scrapers import settings
+from scrapers.pipelines import UnityCatalogWriterPipeline, ValidationPipeline
+
+pytestmark = pytest.mark.slow
+
+# Lowercased crawl output that indicates a startup failure or a deprecation,
+# mapped to the failure message
+FORBIDDEN_OUTPUT = {
+    b"does not support concurrent_requests_per_ip": (
+        "CONCURRENT_REQUESTS_PER_IP error found"
+    ),
+    b"scraper slot not assigned": "Scraper slot error (indicates startup failure)",
+    b"'scheduler' object has no attribute": (
+        "Scheduler attribute error (indicates startup failure)"
+    ),
+    b"error caught on signal handler": "Signal handler error",
+    b"concurrent_requests_per_ip setting is deprecated": (
+        "CONCURRENT_REQUESTS_PER_IP deprecation warning found"
+    ),
+    b"pipeline.process_item() requires a spider argument": (
+        "Pipeline spider argument deprecation warning found"
+    ),
+    b"pipeline.open_spider() requires a spider argument": (
+        "Pipeline open_spider deprecation warning found"
+    ),
+    b"pipeline.close_spider() requires a spider argument": (
+        "Pipeline close_spider deprecation warning found"
+    ),
+}
+FORBIDDEN_OUTPUT_RE = re.compile(b"|".join(map(re.escape, FORBIDDEN_OUTPUT)))
+
 
 class TestSpiderIntegration:
     """Integration tests for running spiders."""
 
-    @pytest.fixture
-    def project_root(self) -> Path:
-        """Get the project root directory."""
-        return Path(__file__).parent.parent
-
+    @pytest.mark.integration
     def test_quality_farm_supply_spider_runs_without_errors(
         self, project_root: Path, tmp_path: Path
     ):
@@ -33,6 +61,10 @@ class TestSpiderIntegration:
         - Settings are valid (no CONCURRENT_REQUESTS_PER_IP error)
         - Pipelines don't raise errors on initialization
         - No critical warnings or errors occur during startup
+
+        The crawl stays in a subprocess: Twisted's reactor cannot be restarted
+        once stopped, so an in-process crawl would break any later test in the
+        same worker that needs it.
         """
         output_file = tmp_path / "test_output.json"
 
@@ -55,90 +87,54 @@ class TestSpiderIntegration:
             ],
             cwd=project_root,
             capture_output=True,
-            text=True,
         )
 
-        # Combine stdout and stderr for checking
-        output = result.stdout + "\n" + result.stderr
-        output_lower = output.lower()
+        # Combine stdout and stderr once and scan it for every forbidden
+        # message in a single pass
+        output_bytes = result.stdout + b"\n" + result.stderr
+        output_lower = output_bytes.lower()
+        output = output_bytes.decode(errors="replace")
 
-        # Should not have the CONCURRENT_REQUESTS_PER_IP error specifically
-        assert "does not support concurrent_requests_per_ip" not in output_lower, (
-            f"CONCURRENT_REQUESTS_PER_IP error found\nOutput: {output}"
-        )
+        forbidden = FORBIDDEN_OUTPUT_RE.search(output_lower)
+        if forbidden is not None:
+            pytest.fail(f"{FORBIDDEN_OUTPUT[forbidden.group()]}\nOutput: {output}")
 
         # Check for ValueError, but allow unrelated ValueErrors
         # (only fail if it's the specific CONCURRENT_REQUESTS_PER_IP error)
-        if "valueerror" in output_lower:
-            assert "concurrent_requests_per_ip" not in output_lower, (
+        if b"valueerror" in output_lower:
+            assert b"concurrent_requests_per_ip" not in output_lower, (
                 f"Spider raised ValueError about CONCURRENT_REQUESTS_PER_IP\n"
                 f"Output: {output}"
             )
 
-        # Should not have these critical errors at startup
-        assert "scraper slot not assigned" not in output_lower, (
-            f"Scraper slot error (indicates startup failure)\nOutput: {output}"
-        )
-        assert "'scheduler' object has no attribute" not in output_lower, (
-            f"Scheduler attribute error (indicates startup failure)\nOutput: {output}"
-        )
-        assert "error caught on signal handler" not in output_lower, (
-            f"Signal handler error\nOutput: {output}"
-        )
-
-        # Should not have these deprecation warnings
-        assert "concurrent_requests_per_ip setting is deprecated" not in output_lower, (
-            f"CONCURRENT_REQUESTS_PER_IP deprecation warning found\nOutput: {output}"
-        )
-        assert (
-            "pipeline.process_item() requires a spider argument" not in output_lower
-        ), f"Pipeline spider argument deprecation warning found\nOutput: {output}"
-        assert (
-            "pipeline.open_spider() requires a spider argument" not in output_lower
-        ), f"Pipeline open_spider deprecation warning found\nOutput: {output}"
-        assert (
-            "pipeline.close_spider() requires a spider argument" not in output_lower
-        ), f"Pipeline close_spider deprecation warning found\nOutput: {output}"
-
         # Check that spider opened successfully (indicates proper configuration)
-        assert "spider opened" in output_lower, (
+        assert b"spider opened" in output_lower, (
             f"Spider did not open successfully\nOutput: {output}"
         )
 
-    def test_spider_list_command_works(self, project_root: Path):
-        """Test that the 'scrapy list' command works and shows expected spiders."""
-        result = subprocess.run(
-            ["python", "-m", "scrapy", "list"],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-        )
-
-        assert result.returncode == 0, f"scrapy list failed: {result.stderr}"
-
+    def test_spider_list_command_works(self, spider_names: set[str]):
+        """Test that the project's spider loader finds the expected spiders."""
         # Should list our spiders
-        assert "quality_farm_supply" in result.stdout, (
+        assert "quality_farm_supply" in spider_names, (
             "quality_farm_supply spider not listed"
         )
 
-    def test_spider_settings_no_deprecated_options(self, project_root: Path):
+    def test_spider_settings_no_deprecated_options(self):
         """Test that spider settings don't use deprecated options."""
-        from scrapers import settings
+        setting_names = vars(settings).keys()
 
         # Check that deprecated setting is not present
-        assert not hasattr(settings, "CONCURRENT_REQUESTS_PER_IP"), (
+        assert "CONCURRENT_REQUESTS_PER_IP" not in setting_names, (
             "CONCURRENT_REQUESTS_PER_IP should not be in settings (deprecated)"
         )
 
         # Check that the non-deprecated alternative is present
-        assert hasattr(settings, "CONCURRENT_REQUESTS_PER_DOMAIN"), (
+        assert "CONCURRENT_REQUESTS_PER_DOMAIN" in setting_names, (
             "CONCURRENT_REQUESTS_PER_DOMAIN should be in settings"
         )
 
-    def test_pipelines_use_modern_api(self, project_root: Path):
+    def test_pipelines_use_modern_api(self):
         """Test that pipelines use the modern Scrapy API (from_crawler)."""
-        from scrapers.pipelines import UnityCatalogWriterPipeline, ValidationPipeline
-
         # Both pipelines should have from_crawler classmethod
         assert hasattr(ValidationPipeline, "from_crawler"), (
             "ValidationPipeline should have from_crawler method"